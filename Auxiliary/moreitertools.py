@@ -23,13 +23,24 @@
 """Additional iteration functions and algorithms."""
 
 import collections.abc
+import heapq
 import itertools
+import math
 from fractions import Fraction
+from functools import partial
 from numbers import Real
+from operator import is_not
 from typing import Callable, Generic, Iterable, Iterator, Optional, Sequence, Type, TypeVar, final, overload
 
 from auxiliary.typing import SupportsLenAndGetitem, SupportsRichComparison
 
+## Numpy is optional, and only used to specialise functions over arrays.
+try:
+    import numpy as _np
+    _HAS_NUMPY: bool = True
+except ImportError:
+    _HAS_NUMPY: bool = False
+
 __all__ = ("getitem_zip",
            "all_equal",
            "first_n",
@@ -38,6 +49,7 @@ __all__ = ("getitem_zip",
            "chunk",
            "max_n",
            "find_first",
+           "find_first_where",
            "find_all",
            "filter_replace",
            "filter_not_none")
@@ -46,16 +58,12 @@ VT = TypeVar("VT")
 RT = TypeVar("RT")
 VT_C = TypeVar("VT_C", bound=SupportsRichComparison)
 
-def __extract_args(*args_or_iterable: VT | Iterable[VT]) -> Iterator[VT]:
-    if len(args_or_iterable) == 1:
-        yield from args_or_iterable[0]
-    else: yield from args_or_iterable
-
 @final
 class getitem_zip(collections.abc.Sequence, Generic[VT]):
     """A class for a sequence-like zip construct supporting `__len__` and `__getitem__`."""
     
     __slots__ = ("__sequences",
+                 "__lengths",
                  "__shortest",
                  "__len",
                  "__fill")
@@ -109,16 +117,23 @@ class getitem_zip(collections.abc.Sequence, Generic[VT]):
         
         The given iterables must support `__len__` and `__getitem__`.
         """
-        if not all(isinstance(sequence, SupportsLenAndGetitem) for sequence in sequences):
-                raise TypeError("All sequences must support __len__ and __getitem__.")
-        if strict and not all_equal(len(seq) for seq in sequences):
+        ## Check the sequences by duck-typing, since instance checks
+        ## against runtime protocols are slow attribute scans.
+        try:
+            lengths: tuple[int, ...] = tuple(len(seq) for seq in sequences)
+        except TypeError as error:
+            raise TypeError("All sequences must support __len__ and __getitem__.") from error
+        if not all(hasattr(type(seq), "__getitem__") for seq in sequences):
+            raise TypeError("All sequences must support __len__ and __getitem__.")
+        if strict and not all_equal(lengths):
             raise ValueError("All sequences must have the same length.")
         self.__sequences: tuple[SupportsLenAndGetitem[VT]] = sequences
+        self.__lengths: tuple[int, ...] = lengths
         self.__shortest: bool = bool(shortest)
         if shortest:
-            self.__len: int = min(len(seq) for seq in sequences)
+            self.__len: int = min(self.__lengths)
         else:
-            self.__len: int = max(len(seq) for seq in sequences)
+            self.__len: int = max(self.__lengths)
         self.__fill: VT | None = fill
     
     @property
@@ -134,26 +149,50 @@ class getitem_zip(collections.abc.Sequence, Generic[VT]):
     def __iter__(self) -> Iterator[tuple[VT | None, ...]]:
         """Get an iterator over the zip."""
         if self.__shortest:
-            yield from zip(*self.__sequences)
-        else:
-            yield from itertools.zip_longest(*self.__sequences, fillvalue=self.__fill)
+            return zip(*self.__sequences)
+        return itertools.zip_longest(*self.__sequences, fillvalue=self.__fill)
     
     def __getitem__(self, index: int) -> tuple[VT | None, ...]:
         """Get a n-length tuple of items, one from each of the n zipped iterables, for the given index."""
+        sequences = self.__sequences
         if self.__shortest:
-            return tuple(sequence[index] for sequence in self.__sequences)
-        return tuple(sequence[index] if index < len(sequence) else self.__fill
-                     for sequence in self.__sequences)
+            return tuple([sequence[index] for sequence in sequences])
+        ## Use the cached lengths to avoid calling `len` on every sequence per access.
+        fill = self.__fill
+        return tuple([sequence[index] if index < length else fill
+                      for sequence, length in zip(sequences, self.__lengths)])
     
     def __len__(self) -> int:
         """Get the length of the zip."""
         return self.__len
 
 def all_equal(iterable: Iterable[VT], hint: bool = False) -> bool:
+    """
+    Return whether all elements of the iterable are equal.
+    
+    If `hint` is True and the iterable is a sequence, then
+    check the first pair of elements and then count occurrences
+    of the first element, instead of grouping by equality.
+    
+    Numpy arrays are compared element-wise in a single vectorised operation.
+    """
+    if _HAS_NUMPY and isinstance(iterable, _np.ndarray):
+        return iterable.size == 0 or bool(_np.all(iterable == iterable.flat[0]))
     if hint and isinstance(iterable, Sequence):
-        return not iterable or iterable.count(iterable[0]) == len(iterable)
+        if len(iterable) < 2:
+            return True
+        ## Exit early if the second element already differs from the first.
+        first, second = iterable[0], iterable[1]
+        if not (second is first or second == first):
+            return False
+        return iterable.count(first) == len(iterable)
     groups = itertools.groupby(iterable)
-    return next(groups, True) and not next(groups, False)
+    next(groups, None)
+    try:
+        next(groups)
+        return False
+    except StopIteration:
+        return True
 
 def first_n(iterable: Iterable[VT], n: int) -> Iterator[VT]:
     """Return the first n elements of an iterable."""
@@ -161,22 +200,12 @@ def first_n(iterable: Iterable[VT], n: int) -> Iterator[VT]:
 
 def iter_to_length(iterable: Iterable[Optional[VT]], length: int, fill: VT) -> Iterator[VT]:
     """
-    Yield items from the iterable up to the given length.
+    Return an iterator over items from the iterable up to the given length.
     
-    If the fill value is given and not None then instead yield the
-    fill value if the iterable is exhausted before the given length.
+    If the iterable is exhausted before the given length,
+    then the iterator is padded with the fill value.
     """
-    if isinstance(iterable, Sequence):
-        if len(iterable) >= length:
-            yield from itertools.islice(iterable, length)
-        else:
-            yield from iterable
-            yield from itertools.repeat(fill, length - len(iterable))
-    else:
-        for index, element in enumerate(iterable):
-            yield element
-        if index < length:
-            yield from itertools.repeat(fill, length - index)
+    return itertools.islice(itertools.chain(iterable, itertools.repeat(fill)), length)
 
 def cycle_for(sequence: Sequence[VT],
               cycles: Real,
@@ -194,16 +223,18 @@ def cycle_for(sequence: Sequence[VT],
     if `preempt` is True it will yield `rounddown(len(iterables) * cycles)` number of items.
     """
     cycles = Fraction(cycles)
-    if cycles > 0:
-        cycled = Fraction(0.0)
-        cycles_per_item = Fraction(f"1/{len(sequence)}")
-        i: int = 0
-        while ((not preempt and cycled < cycles)
-               or (cycled + cycles_per_item) < cycles):
-            i %= len(sequence)
-            yield sequence[i]
-            i += 1
-            cycled += cycles_per_item
+    length: int = len(sequence)
+    if cycles > 0 and length > 0:
+        ## Determine the total number of items to yield once with exact
+        ## rational arithmetic, and then yield whole cycles of the sequence
+        ## followed by the remaining partial cycle, without indexing per item.
+        if preempt:
+            total: int = math.floor(cycles * length)
+        else: total: int = math.ceil(cycles * length)
+        whole_cycles, remainder = divmod(total, length)
+        for _ in range(whole_cycles):
+            yield from sequence
+        yield from itertools.islice(sequence, remainder)
 
 def chunk(iterable: Iterable[VT],
           size: int,
@@ -223,17 +254,24 @@ def chunk(iterable: Iterable[VT],
         if isinstance(as_type, type):
             _type = as_type
         else: _type = type(iterable)
-        yield from (_type(iterable[index : index + size])
-                    for index in range(0, quantity * size, size))
+        slices = (iterable[index : index + size]
+                  for index in range(0, quantity * size, size))
+        ## Slices of built-in sequences are already of the same type,
+        ## otherwise construct the chunks with the C-level map.
+        if _type is type(iterable) and _type in (list, tuple, str):
+            yield from slices
+        else: yield from map(_type, slices)
     ## Otherwise chunk by iterator.
     else:
         iterator = iter(iterable)
+        sentinel = object()
         for _ in range(quantity):
-            ## Advance the iterator to the next chunk and yield
-            ## the chunk as an iterator if such a chunk exists.
-            if chunk_ := itertools.islice(iterator, size):
-                yield chunk_
-            else: break
+            ## Advance the iterator to the next chunk and yield the chunk as
+            ## an iterator if such a chunk exists (islice objects are always
+            ## truthy, so check for exhaustion by taking the first element).
+            if (first := next(iterator, sentinel)) is sentinel:
+                break
+            yield itertools.chain((first,), itertools.islice(iterator, size - 1))
 
 @overload
 def max_n(iterable: Iterable[VT_C], *, n: int = 1) -> VT_C | list[VT_C]:
@@ -256,25 +294,34 @@ def max_n(*args: VT_C, n: int = 1, key: Callable[[VT_C], SupportsRichComparison]
 
 def max_n(*args_or_iterable: VT_C | Iterable[VT_C], n: int = 1, key: Callable[[VT_C], SupportsRichComparison] | None = None) -> VT_C | list[VT_C]:
     """Return the n largest elements of an iterable."""
-    iterable = __extract_args(*args_or_iterable)
+    if len(args_or_iterable) == 1:
+        iterable = args_or_iterable[0]
+    else: iterable = args_or_iterable
     if n == 1:
         return max(iterable, key=key)
-    return sorted(iterable, key=key)[:n]
+    return heapq.nlargest(n, iterable, key=key)
 
 def find_first(iterable: Iterable[VT], condition: Callable[[int, VT], bool]) -> tuple[int, VT]:
-    """Find the first element of the iterable where the condition holds true."""
+    """
+    Find the first element of the iterable where the condition holds true.
+    
+    If the condition does not depend on the index of the element,
+    use `find_first_where` instead, which avoids enumerating the iterable.
+    """
     for index, element in enumerate(iterable):
         if condition(index, element):
             return (index, element)
 
+def find_first_where(iterable: Iterable[VT], condition: Callable[[VT], bool]) -> Optional[VT]:
+    """Find the first element of the iterable where the condition holds true, return None if there is no such element."""
+    return next(filter(condition, iterable), None)
+
 def find_all(iterable: Iterable[VT],
              condition: Callable[[int, VT], bool],
              limit: Optional[int] = None
              ) -> Iterator[tuple[int, VT]]:
-    """Return an iterator over all the elements of the iterable where the condition holds true."""
-    for index, element in enumerate(iterable):
-        if index == limit:
-            break
+    """Return an iterator over all the elements of the iterable (up to the limit index) where the condition holds true."""
+    for index, element in enumerate(itertools.islice(iterable, limit)):
         if condition(index, element):
             yield (index, element)
 
@@ -286,4 +333,4 @@ def filter_replace(iterable: Iterable[VT],
 
 def filter_not_none(iterable: Iterable[VT]) -> Iterator[VT]:
     """Return an iterator over the items of the iterable which are not None."""
-    return (arg for arg in iterable if arg is not None)
+    return filter(partial(is_not, None), iterable)
@@ -21,20 +21,51 @@
 ###########################################################################
 
 import collections.abc
-from dataclasses import dataclass
 from numbers import Real
 from typing import Callable, Generic, Hashable, Iterable, Iterator, Optional, TypeVar, overload
-import heapq
+from heapq import heapify, heappop, heappush, heapreplace
 
 from Auxiliary.Typing import HashableSupportsRichComparison
 
 ST = TypeVar("ST", bound=HashableSupportsRichComparison)
 
-@dataclass(frozen=True, order=True)
 class QItem(Generic[ST]):
-    "Dataclass for storing custom valued sorted queue items."
-    value: Real
-    item: ST
+    """
+    Class for storing custom valued sorted queue items.
+    
+    Items are ordered only by their values, such that items
+    with equal values are never compared to each other.
+    """
+    
+    __slots__ = ("value",
+                 "item")
+    
+    def __init__(self, value: Real, item: ST) -> None:
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "item", item)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot assign to field '{name}' of immutable {self.__class__.__name__}.")
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r}, item={self.item!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QItem):
+            return NotImplemented
+        return self.value == other.value and self.item == other.item
+    
+    def __lt__(self, other: "QItem[ST]") -> bool:
+        return self.value < other.value
+    
+    def __le__(self, other: "QItem[ST]") -> bool:
+        return self.value <= other.value
+    
+    def __gt__(self, other: "QItem[ST]") -> bool:
+        return self.value > other.value
+    
+    def __ge__(self, other: "QItem[ST]") -> bool:
+        return self.value >= other.value
     
     def __hash__(self) -> int:
         return hash(self.item)
@@ -44,6 +75,7 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
     A sorted queue implementation wrapping Python's built-in heap-queue algorithm.
     
     An additional hash table is used to allow for fast membership tests, at the cost of memory.
+    The hash table also caches the key values of items, such that the key function is called only once per pushed item.
     Similarly, a lazy delete list is used to allow to fast member removal without the need to re-heapify the queue, at the cost of memory.
     
     Iterating over the queue does not necessary yield items in sorted order.
@@ -51,8 +83,8 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
     """
     
     __slots__ = ("__heap",
-                 "__get",
-                 "__set",
+                 "__key",
+                 "__sign",
                  "__members",
                  "__delete")
     
@@ -114,36 +146,36 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
                  min_first: bool = True
                  ) -> None:
         
+        ## A single argument is either an iterable of items or a lone item.
         if len(items) == 1:
             try:
-                iterable = iter(items[0])
-                items = items[0]
-            except:
-                items = [items]
-                iterable = iter(items)
-        else: iterable = iter(items)
-        
-        ## The queue itself is a heap;
-        ##      - The get and set functions convert
-        ##        to and from the value-item tuples
-        ##        if the key function is given.
+                items = iter(items[0])
+            except TypeError:
+                pass
+        
+        ## Store a mapping of members to their key values (None if no key
+        ## function is given) for fast membership checks;
+        ##      - The items are consumed exactly once, so that the heap
+        ##        can be built from the members (even for generators),
+        ##        which also ensures the heap contains no duplicates,
+        ##      - Caching the key values ensures the (possibly expensive)
+        ##        key function is called only once per pushed item.
+        ## The queue itself is a heap, of value-item pairs if the key function is given.
         if key is None:
-            self.__heap: list[ST] = list(iterable)
-            self.__get: Callable[[ST], ST] = lambda item: item
-            self.__set: Callable[[ST], ST] = self.__get
+            self.__members: dict[ST, Real | None] = dict.fromkeys(items)
+            self.__heap: list[ST] = list(self.__members)
         else:
-            if not min_first:
-                key = lambda item: -key(item)
-            self.__heap: list[QItem[ST]] = [QItem(key(item), item)
-                                            for item in iterable]
-            self.__get: Callable[[QItem[ST]], ST] = lambda qitem: qitem.item
-            self.__set: Callable[[ST], QItem[ST]] = lambda item: QItem(key(item), item)
+            ## The sign of the key values is applied directly, rather than
+            ## wrapping the key function, to avoid an extra call per item.
+            sign: int = 1 if min_first else -1
+            self.__members: dict[ST, Real | None] = {item : sign * key(item) for item in items}
+            self.__heap: list[QItem[ST]] = [QItem(value, item)
+                                            for item, value in self.__members.items()]
+        self.__key: Optional[Callable[[ST], Real]] = key
+        self.__sign: int = 1 if min_first else -1
         
         ## Heapify the heap.
-        heapq.heapify(self.__heap)
-        
-        ## Store a set of members for fast membership checks.
-        self.__members: set[ST] = set(items)
+        heapify(self.__heap)
         
         ## Store a lazy delete "list" for fast item removal.
         self.__delete: set[ST] = set()
@@ -160,7 +192,7 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
         return item in self.__members
     
     def __iter__(self) -> Iterator[ST]:
-        yield from self.__members
+        return iter(self.__members)
     
     def __len__(self) -> int:
         return len(self.__members)
@@ -176,11 +208,15 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
         ----------
         `item: ST@SortedQueue` - The item to push.
         """
-        if item not in self:
-            self.__members.add(item)
+        if item not in self.__members:
+            key = self.__key
+            value = None if key is None else self.__sign * key(item)
+            self.__members[item] = value
             if item in self.__delete:
                 self.__delete.remove(item)
-            else: heapq.heappush(self.__heap, self.__set(item))
+            elif key is None:
+                heappush(self.__heap, item)
+            else: heappush(self.__heap, QItem(value, item))
     
     @overload
     def push_all(self, *items: ST) -> None:
@@ -212,13 +248,29 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
         ## operations to speed up the necessary membership testing.
         if isinstance(items, set):
             ## Add all items that are not already members.
-            items = items - self.__members
-            self.__members |= items
+            members = self.__members
+            key = self.__key
+            items = items - members.keys()
+            if key is None:
+                members.update(dict.fromkeys(items))
+            else:
+                sign: int = self.__sign
+                members.update({item : sign * key(item) for item in items})
             
-            ## Push all items not in the lazy delete list to the heap.
+            ## Push all items not in the lazy delete list to the heap;
+            ##      - If the number of items is large relative to the heap,
+            ##        it is cheaper to extend the heap and re-heapify it in
+            ##        linear time than to push each item individually.
             push_items = items - self.__delete
-            for item in push_items:
-                heapq.heappush(self.__heap, self.__set(item))
+            if key is None:
+                entries = push_items
+            else: entries = [QItem(members[item], item) for item in push_items]
+            if len(push_items) * 4 >= len(self.__heap):
+                self.__heap.extend(entries)
+                heapify(self.__heap)
+            else:
+                for entry in entries:
+                    heappush(self.__heap, entry)
             
             ## Remove lazy deletes for non-members.
             self.__delete -= items
@@ -240,12 +292,16 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
         ------
         `IndexError` - If the queue is empty.
         """
-        while self:
-            item: ST = self.__get(heapq.heappop(self.__heap))
-            if item not in self.__delete:
-                self.__members.remove(item)
+        heap, members, delete = self.__heap, self.__members, self.__delete
+        keyed: bool = self.__key is not None
+        while members:
+            item: ST = heappop(heap)
+            if keyed:
+                item = item.item
+            if item not in delete:
+                del members[item]
                 return item
-            self.__delete.remove(item)
+            delete.remove(item)
         raise IndexError("Pop from empty sorted queue.")
     
     def remove(self, item: ST) -> None:
@@ -261,7 +317,7 @@ class SortedQueue(collections.abc.Collection, Generic[ST]):
         `KeyError` - If given item is not in the queue.
         """
         if item in self:
-            self.__members.remove(item)
+            del self.__members[item]
             self.__delete.add(item)
         else: raise KeyError(f"The item {item} is not in the sorted queue.")
 
@@ -273,14 +329,16 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
     A priority queue implementation wrapping Python's built-in heap-queue algorithm.
     
     An additional hash table is used to allow for fast membership tests, at the cost of memory.
-    Similarly, a lazy delete list is used to allow to fast member removal without the need to re-heapify the queue, at the cost of memory.
+    Similarly, lazy deletion is used to allow fast member removal and priority updates without the need to re-heapify the queue.
+    Each heap entry is stamped with a unique version number, and entries whose version is not the current version of their item are stale and discarded when popped.
     
     Iterating over the queue does not necessary yield items in priority order.
     """
     
     __slots__ = ("__heap",
                  "__members",
-                 "__delete")
+                 "__version",
+                 "__counter")
     
     @overload
     def __init__(self,
@@ -308,29 +366,33 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
                  *items: tuple[QT, VT] | Iterable[tuple[QT, VT]]
                  ) -> None:
         
-        if len(items) == 1:
-            if not isinstance(items, tuple):
-                items = iter(items[0])
-            else: items = [items]
+        ## A single argument is either an iterable of pairs or a lone pair.
+        if len(items) == 1 and not isinstance(items[0], tuple):
+            items = items[0]
         
         ## Store a set of members for fast membership checks.
         self.__members: dict[QT, VT] = dict(items)
         
+        ## Store the current version of each member for lazy deletion;
+        ##      - Versions are drawn from a monotonic counter, so they are
+        ##        never reused, and also break ties between equal priorities
+        ##        without needing to compare the items themselves.
+        self.__version: dict[QT, int] = {item : version for version, item in enumerate(self.__members)}
+        self.__counter: int = len(self.__members)
+        
         ## The queue itself is a heap.
-        self.__heap: list[tuple[VT, QT]] = [(value, item) for item, value in self.__members.items()]
+        self.__heap: list[tuple[VT, int, QT]] = [(priority, self.__version[item], item)
+                                                 for item, priority in self.__members.items()]
         
         ## Heapify the heap.
-        heapq.heapify(self.__heap)
-        
-        ## Store a lazy delete "list" for fast item removal.
-        self.__delete: set[tuple[VT, QT]] = set()
+        heapify(self.__heap)
     
     def __str__(self) -> str:
         return f"Priority Queue: items = {len(self)}"
     
     def __repr__(self) -> str:
-        if not self.__delete:
-            return repr(self.__heap)
+        if len(self.__heap) == len(self.__members):
+            return repr([(priority, item) for priority, _, item in self.__heap])
         return repr(list(self))
     
     def __contains__(self, item: QT) -> bool:
@@ -346,7 +408,7 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
         self.remove(item)
     
     def __iter__(self) -> Iterator[QT]:
-        yield from self.__members
+        return iter(self.__members)
     
     def __len__(self) -> int:
         return len(self.__members)
@@ -366,15 +428,97 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
         
         `item: QT@PriorityQueue` - The item to push.
         """
-        if item not in self:
+        ## Pushing a new version of the item makes any existing entry stale.
+        self.__members[item] = priority
+        self.__version[item] = version = self.__counter
+        self.__counter += 1
+        heappush(self.__heap, (priority, version, item))
+        self.__compact()
+    
+    @overload
+    def push_all(self, *items: tuple[QT, VT]) -> None:
+        """
+        Push a series of item to priority pairs onto the queue in-place.
+        
+        Parameters
+        ----------
+        `*items: (QT@PriorityQueue, VT@PriorityQueue)` - The item and priority pairs to push.
+        """
+        ...
+    
+    @overload
+    def push_all(self, items: Iterable[tuple[QT, VT]]) -> None:
+        """
+        Push an iterable of item to priority pairs onto the queue in-place.
+        
+        Parameters
+        ----------
+        `items: Iterable[(QT@PriorityQueue, VT@PriorityQueue)]` - The item and priority pairs to push.
+        """
+        ...
+    
+    def push_all(self, *items: tuple[QT, VT] | Iterable[tuple[QT, VT]]) -> None:
+        if len(items) == 1 and not isinstance(items[0], tuple):
+            items = items[0]
+        
+        ## Stamp all items with new versions, making any existing entries stale.
+        entries: list[tuple[VT, int, QT]] = []
+        for item, priority in items:
             self.__members[item] = priority
-            if (priority, item) in self.__delete:
-                self.__delete.remove((priority, item))
-            else: heapq.heappush(self.__heap, (priority, item))
+            self.__version[item] = version = self.__counter
+            self.__counter += 1
+            entries.append((priority, version, item))
+        
+        ## If the number of items is large relative to the heap,
+        ## it is cheaper to extend the heap and re-heapify it in
+        ## linear time than to push each item individually.
+        if len(entries) * 4 >= len(self.__heap):
+            self.__heap.extend(entries)
+            heapify(self.__heap)
         else:
-            self.__delete.add((self.__members[item], item))
-            self.__members[item] = priority
-            heapq.heappush(self.__heap, (priority, item))
+            for entry in entries:
+                heappush(self.__heap, entry)
+        self.__compact()
+    
+    def pushpop(self, priority: VT, item: QT, /) -> QT:
+        """
+        Push an item onto the queue with given priority and then pop the lowest priority item.
+        
+        This is more efficient than a call to `push` followed by a call to `pop`.
+        If the item is already present, its priority is replaced with the given value.
+        
+        Parameters
+        ----------
+        `priority: VT@PriorityQueue` - The priority of the item.
+        
+        `item: QT@PriorityQueue` - The item to push.
+        
+        Returns
+        -------
+        `QT@PriorityQueue` - The lowest priority item, which may be the pushed item.
+        """
+        if item in self:
+            self.push(priority, item)
+            return self.pop()
+        
+        ## Discard stale entries such that the top of the heap is a member.
+        heap = self.__heap
+        while heap and self.__version.get(heap[0][2]) != heap[0][1]:
+            heappop(heap)
+        
+        ## The pushed item would be popped immediately if its priority is lower than the top.
+        if not heap or priority < heap[0][0]:
+            return item
+        
+        ## Otherwise replace the top of the heap with the pushed item in a single sift.
+        version = self.__counter
+        self.__counter += 1
+        _, _, popped_item = heapreplace(heap, (priority, version, item))
+        del self.__version[popped_item]
+        del self.__members[popped_item]
+        self.__members[item] = priority
+        self.__version[item] = version
+        return popped_item
     
     def pop(self) -> QT:
         """
@@ -388,13 +532,7 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
         ------
         `IndexError` - If the queue is empty.
         """
-        while self:
-            priority, item = heapq.heappop(self.__heap)
-            if (priority, item) not in self.__delete:
-                del self.__members[item]
-                return item
-            self.__delete.remove((priority, item))
-        raise IndexError("Pop from empty priority queue.")
+        return self.popitem()[0]
     
     def popitem(self) -> tuple[QT, VT]:
         """
@@ -408,12 +546,13 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
         ------
         `IndexError` - If the queue is empty.
         """
-        while self:
-            priority, item = heapq.heappop(self.__heap)
-            if (priority, item) not in self.__delete:
-                del self.__members[item]
+        heap, members, versions = self.__heap, self.__members, self.__version
+        while members:
+            priority, version, item = heappop(heap)
+            if versions.get(item) == version:
+                del versions[item]
+                del members[item]
                 return (item, priority)
-            self.__delete.remove((priority, item))
         raise IndexError("Pop from empty priority queue.")
     
     def remove(self, item: QT) -> None:
@@ -429,6 +568,21 @@ class PriorityQueue(collections.abc.MutableMapping, Generic[VT, QT]):
         `KeyError` - If given item is not in the queue.
         """
         if item in self:
-            self.__delete.add((self.__members[item], item))
+            del self.__version[item]
             del self.__members[item]
-        else: raise KeyError(f"The item {item} is not in the priority queue.")
\ No newline at end of file
+            self.__compact()
+        else: raise KeyError(f"The item {item} is not in the priority queue.")
+    
+    def __compact(self) -> None:
+        """
+        Remove stale entries from the heap if they outnumber the members.
+        
+        Every member has exactly one current entry in the heap, so the remaining entries are stale.
+        Rebuilding the heap in linear time once stale entries dominate bounds its memory usage,
+        and the cost of the rebuild is amortised over the operations that created those entries.
+        """
+        if len(self.__heap) > 2 * len(self.__members):
+            versions = self.__version
+            self.__heap = [entry for entry in self.__heap
+                           if versions.get(entry[2]) == entry[1]]
+            heapify(self.__heap)
\ No newline at end of file
@@ -23,6 +23,7 @@
 """General implementation of a genetic optimisation algorithm."""
 
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import dataclasses
 import enum
 from fractions import Fraction
@@ -31,13 +32,12 @@ import functools
 import itertools
 import math
 from numbers import Real
-from random import getrandbits as randbits
-from typing import Any, Callable, Generic, Iterable, Iterator, Literal, Optional, Type, TypeVar
-from numpy import isin, right_shift
-from numpy.random import choice, randint, random_integers, Generator, default_rng
+from typing import Any, Callable, ClassVar, Generic, Iterable, Literal, Optional, Type, TypeVar
+import numpy as np
+import numpy.typing as npt
+from numpy.random import Generator, default_rng
 
 from auxiliary.ProgressBars import ResourceProgressBar
-from auxiliary.moreitertools import chunk, cycle_for, getitem_zip, max_n
 
 ## Need to be able to deal with degree of mutation based on the range.
 ## For arbitrary bases, this will be based on the order of the possible values in the base.
@@ -51,33 +51,73 @@ NT = TypeVar("NT", bound=Real)
 ## Generic gene base type (used for arbitrary base types).
 GT = TypeVar("GT")
 
-## Generic chromosome type (i.e. genotype).
-CT = TypeVar("CT", str, list)
+## Generic chromosome type (i.e. genotype);
+##      - A chromosome is a one-dimensional array of genes,
+##      - A population of chromosomes is stored as a single two-dimensional
+##        array, with one chromosome per row, such that genetic operators
+##        can act on (slices of) rows without per-gene Python overhead.
+CT = TypeVar("CT", bound=np.ndarray)
 
 ## Generic solution type (i.e. phenotype).
 ST = TypeVar("ST")
 
-class GeneBase(Generic[CT], metaclass=ABCMeta):
-    """Base class for gene base types."""
+class GeneBase(metaclass=ABCMeta):
+    """
+    Base class for gene base types.
+    
+    The `tag` of a base type is an integer identifying which of the specialised methods
+    of genetic operators handles it; one of `BITSTRING`, `NUMERICAL`, `ARBITRARY` or `PACKED`.
+    Operators can index a tuple of methods by the tag, instead of checking the base's type.
+    """
+    
+    BITSTRING: ClassVar[int] = 0
+    NUMERICAL: ClassVar[int] = 1
+    ARBITRARY: ClassVar[int] = 2
+    PACKED: ClassVar[int] = 3
+    tag: ClassVar[int] = ARBITRARY
     
     @abstractmethod
-    def random_chromosomes(self, length: int, quantity: int) -> list[CT]:
-        """Return the given quantity of random chromosomes of the given length."""
+    def random_chromosomes(self, length: int, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
+        """
+        Return the given quantity of random chromosomes of the given length,
+        as a two-dimensional array with one chromosome per row.
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed to create one, None generates a random seed.
+        """
         ...
     
     @abstractmethod
-    def random_genes(self, quantity: int) -> list[GT]:
-        """Return the given quantity of random genes."""
+    def random_genes(self, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
+        """Return the given quantity of random genes as a one-dimensional array."""
         ...
 
+def _random_bit_values(generator: Generator, bits: int, shape: tuple[int, int]) -> npt.NDArray[np.uint8]:
+    """
+    Return a two-dimensional array of the given shape of random integers in the range [0, 2^bits).
+    
+    The values are drawn from a single buffer of random bytes, which is much faster
+    than drawing each value as a separate bounded integer. Binary values are unpacked
+    eight to a byte, and other values are taken from the low bits of one byte each.
+    """
+    rows, length = shape
+    if bits == 1:
+        random_bytes = np.frombuffer(generator.bytes(rows * -(-length // 8)), dtype=np.uint8)
+        return np.unpackbits(random_bytes.reshape(rows, -1), axis=1, count=length)
+    random_bytes = np.frombuffer(generator.bytes(rows * length), dtype=np.uint8)
+    return random_bytes.reshape(rows, length) & np.uint8((1 << bits) - 1)
+
 @dataclasses.dataclass(frozen=True) ## TODO: Change to a normal class, take "bin", "hex", or "oct" as argument.
-class BitStringBase(GeneBase[str]):
+class BitStringBase(GeneBase):
     """
     Represents a bit-string gene base type.
     
     Genes can take only integer values between;
     0 and 2^bits-1 encoded in the given numerical base.
     
+    Chromosomes are stored as arrays of the integer values of their genes,
+    and are converted to and from strings only at the encoder boundary.
+    
     Fields
     ------
     `name: str` - The name of the base type.
@@ -97,9 +137,15 @@ class BitStringBase(GeneBase[str]):
     -------
     `chromosome_bits: (length: int) -> int` - Return the number of bits needed to represent a chromosome of the given length.
     
-    `random_chromosomes: (length: int) -> str` - Return a random chromosome of the given length.
+    `random_chromosomes: (length: int, quantity: int) -> NDArray[uint8]` - Return random chromosomes of the given length.
+    
+    `to_string: (chromosome: NDArray[uint8]) -> str` - Return the given chromosome as a string.
+    
+    `from_string: (string: str) -> NDArray[uint8]` - Return the chromosome represented by the given string.
     """
     
+    tag: ClassVar[int] = GeneBase.BITSTRING
+    
     name: str
     format_: str
     bits: int
@@ -118,17 +164,50 @@ class BitStringBase(GeneBase[str]):
         """Return the range of possible values a gene can take for the given base type in ascending order."""
         return tuple(format(v, self.format_) for v in range(self.total_values))
     
+    @cached_property
+    def encode_table(self) -> npt.NDArray[np.uint8]:
+        """Return an array of the character codes of the possible values a gene can take, indexable by the integer value of the gene."""
+        return np.frombuffer("".join(self.all_values).encode("ascii"), dtype=np.uint8)
+    
+    @cached_property
+    def decode_table(self) -> npt.NDArray[np.uint8]:
+        """
+        Return an array of the integer values of genes, indexable by the character codes of their values.
+        
+        Codes of characters that are not valid values map to the number of possible values.
+        """
+        table = np.full(128, self.total_values, dtype=np.uint8)
+        values = np.arange(self.total_values, dtype=np.uint8)
+        table[self.encode_table] = values
+        table[np.frombuffer("".join(self.all_values).upper().encode("ascii"), dtype=np.uint8)] = values
+        return table
+    
     def chromosome_bits(self, length: int) -> int:
         """Return the number of bits needed to represent a chromosome of the given length."""
         return self.bits * length
     
-    def random_chromosomes(self, length: int, quantity: int) -> list[str]:
+    def random_chromosomes(self, length: int, quantity: int, rng: Generator | int | None = None) -> npt.NDArray[np.uint8]:
         """Return the given quantity of random chromosomes of the given length."""
-        return [format(randbits(self.chromosome_bits(length)), self.format_).zfill(length) for _ in range(quantity)]
+        return _random_bit_values(default_rng(rng), self.bits, (quantity, length))
     
-    def random_genes(self, quantity: int) -> list[str]:
+    def random_genes(self, quantity: int, rng: Generator | int | None = None) -> npt.NDArray[np.uint8]:
         """Return the given quantity of random genes."""
-        return [format(randbits(self.bits), self.format_) for _ in range(quantity)]
+        return _random_bit_values(default_rng(rng), self.bits, (1, quantity))[0]
+    
+    def to_string(self, chromosome: npt.NDArray[np.uint8]) -> str:
+        """Return the given chromosome as a string of characters in the given numerical base."""
+        return self.encode_table[chromosome].tobytes().decode("ascii")
+    
+    def from_string(self, string: str) -> npt.NDArray[np.uint8]:
+        """Return the chromosome represented by the given string of characters in the given numerical base."""
+        try:
+            codes = np.frombuffer(string.encode("ascii"), dtype=np.uint8)
+        except UnicodeEncodeError as error:
+            raise ValueError(f"Invalid {self.name} string; {string!r}.") from error
+        chromosome = self.decode_table[codes]
+        if (chromosome == self.total_values).any():
+            raise ValueError(f"Invalid {self.name} string; {string!r}.")
+        return chromosome
 
 @enum.unique
 class BitStringBaseTypes(enum.Enum):
@@ -152,13 +231,77 @@ class BitStringBaseTypes(enum.Enum):
     hex = BitStringBase("hexadecimal", 'x', 4)
 
 @dataclasses.dataclass(frozen=True)
-class NumericalBase(GeneBase[list], Generic[NT]):
+class PackedBitStringBase(GeneBase):
+    """
+    Represents a binary gene base type, with genes packed into 64-bit words.
+    
+    Chromosomes of the given length are stored as arrays of `ceil(length / 64)` unsigned
+    64-bit integers, where gene `i` is bit `i % 64` of word `i // 64`, and the unused
+    bits of the last word are always zero. This uses an eighth of the memory of the
+    standard binary base, and allows bitwise operators to act on 64 genes at once.
+    
+    Fields
+    ------
+    `length: int` - The number of genes in a chromosome.
+    
+    `name: str = "packed binary"` - The name of the base type.
+    """
+    
+    tag: ClassVar[int] = GeneBase.PACKED
+    
+    length: int
+    name: str = "packed binary"
+    
+    def __post_init__(self) -> None:
+        """Check that the given length is valid."""
+        if self.length < 1:
+            raise ValueError(f"Length of chromosomes must be greater than zero. Got; {self.length=}.")
+    
+    @property
+    def words(self) -> int:
+        """Return the number of 64-bit words needed to store a chromosome."""
+        return -(-self.length // 64)
+    
+    @property
+    def last_word_mask(self) -> np.uint64:
+        """Return the mask of the bits of the last word of a chromosome that store genes."""
+        if (remainder := self.length % 64) == 0:
+            return np.uint64(np.iinfo(np.uint64).max)
+        return np.uint64((1 << remainder) - 1)
+    
+    def random_chromosomes(self, length: int, quantity: int, rng: Generator | int | None = None) -> npt.NDArray[np.uint64]:
+        """Return the given quantity of random chromosomes of the given length."""
+        if length != self.length:
+            raise ValueError(f"Length of chromosomes must equal the length of the base. Got; {length=}, {self.length=}.")
+        chromosomes = default_rng(rng).integers(0, np.iinfo(np.uint64).max, size=(quantity, self.words),
+                                                dtype=np.uint64, endpoint=True)
+        chromosomes[:, -1] &= self.last_word_mask
+        return chromosomes
+    
+    def random_genes(self, quantity: int, rng: Generator | int | None = None) -> npt.NDArray[np.uint8]:
+        """Return the given quantity of random (unpacked) genes."""
+        return default_rng(rng).integers(0, 2, size=quantity, dtype=np.uint8)
+    
+    def pack(self, genes: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint64]:
+        """Return the chromosome represented by the given array of binary gene values."""
+        packed = np.zeros(self.words * 8, dtype=np.uint8)
+        packed[:-(-self.length // 8)] = np.packbits(genes, bitorder="little")
+        return packed.view("<u8").astype(np.uint64)
+    
+    def unpack(self, chromosome: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint8]:
+        """Return the binary gene values of the given chromosome."""
+        return np.unpackbits(chromosome.astype("<u8").view(np.uint8), count=self.length, bitorder="little")
+
+@dataclasses.dataclass(frozen=True)
+class NumericalBase(GeneBase, Generic[NT]):
     """
     Represents an numerical base type.
     
     Genes can take any value from a given range.
     """
     
+    tag: ClassVar[int] = GeneBase.NUMERICAL
+    
     name: str
     type_: Type[Real]
     min_range: NT
@@ -169,16 +312,16 @@ class NumericalBase(GeneBase[list], Generic[NT]):
         if self.min_range >= self.max_range:
             raise ValueError(f"Minimum of range must be less than maximum of range. Got; {self.min_range=} and {self.max_range=}.")
     
-    def random_chromosomes(self, length: int, quantity: int) -> list[list[NT]]:
+    def random_chromosomes(self, length: int, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
         """Return the given quantity of random chromosomes of the given length."""
-        return chunk(random_integers(self.min_range, self.max_range, length * quantity), length, quantity, as_type=list)
+        return default_rng(rng).integers(self.min_range, self.max_range, size=(quantity, length), endpoint=True)
     
-    def random_genes(self, quantity: int) -> list[NT]:
+    def random_genes(self, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
         """Return the given quantity of random genes."""
-        return random_integers(self.min_range, self.max_range, quantity).tolist()
+        return default_rng(rng).integers(self.min_range, self.max_range, size=quantity, endpoint=True)
 
 @dataclasses.dataclass(frozen=True)
-class ArbitraryBase(GeneBase[list], Generic[GT]):
+class ArbitraryBase(GeneBase, Generic[GT]):
     """
     Represents an arbitrary base type.
     
@@ -194,15 +337,38 @@ class ArbitraryBase(GeneBase[list], Generic[GT]):
                 + ", ".join(str(v) for v in self.values[:min(len(self.values, 5))])
                 + (", ..." if len(self.values) > 5 else ""))
     
-    def random_chromosomes(self, length: int, quantity: int) -> list[list[GT]]:
+    @cached_property
+    def values_array(self) -> npt.NDArray:
+        """Return the possible values a gene can take as an array, indexable by the index of the value."""
+        return np.asarray(self.values)
+    
+    @cached_property
+    def value_indices(self) -> dict[GT, int]:
+        """Return a mapping of the possible values a gene can take to their indices."""
+        return {value : index for index, value in enumerate(self.values)}
+    
+    def indices_of(self, genes: npt.NDArray) -> npt.NDArray[np.intp]:
+        """Return the indices of the values of the given one-dimensional array of genes."""
+        value_indices = self.value_indices
+        return np.fromiter((value_indices[gene] for gene in genes.tolist()), dtype=np.intp, count=len(genes))
+    
+    def random_chromosomes(self, length: int, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
         """Return the given quantity of random chromosomes of the given length."""
-        return chunk(choice(self.values, length * quantity), length, quantity, as_type=list)
+        return self.values_array[default_rng(rng).integers(0, len(self.values), size=(quantity, length))]
     
-    def random_genes(self, quantity: int) -> list[GT]:
+    def random_genes(self, quantity: int, rng: Generator | int | None = None) -> npt.NDArray:
         """Return the given quantity of random genes."""
-        return choice(self.values, quantity).tolist()
+        return self.values_array[default_rng(rng).integers(0, len(self.values), size=quantity)]
 
 
+## Functions for creating gene bases from the types of base accepted by genetic encoders.
+_BASE_DISPATCH: dict[type, Callable[[Any], GeneBase]] = {
+    str: lambda base: BitStringBaseTypes[base].value,
+    BitStringBaseTypes: lambda base: base.value,
+    list: lambda base: ArbitraryBase("arbitrary", tuple(base)),
+    tuple: lambda base: ArbitraryBase("arbitrary", base),
+    GeneBase: lambda base: base
+}
 
 class GeneticEncoder(Generic[ST], metaclass=ABCMeta):
     """
@@ -222,19 +388,17 @@ class GeneticEncoder(Generic[ST], metaclass=ABCMeta):
     def __init__(self,
                  chromosome_length: int = 8,
                  chunks: int | None = None,
-                 base: BitStringBaseTypes | Literal["bin", "oct", "hex"] | list[GT] | ArbitraryBase = "bin", ## TODO
+                 base: GeneBase | BitStringBaseTypes | Literal["bin", "oct", "hex"] | list[GT] | tuple[GT] = "bin", ## TODO
                  ) -> None:
         """Create a genetic encoder with a given gene length and base type."""
         self.__chromosome_length: int = chromosome_length
-        if not isinstance(base, str):
-            self.__base = BitStringBaseTypes[base].value
-        elif isinstance(base, BitStringBaseTypes):
-            self.__base = base.value
-        elif isinstance(base, list):
-            self.__base = ArbitraryBase("arbitrary", base)
-        elif isinstance(base, ArbitraryBase):
-            self.__base = base
-        else: raise TypeError(F"Unknown base; {base} of type {type(base)}. Expected one of: BitStringBase, str, list, ArbitraryBase.")
+        ## Find the most specific type of the base that has a dispatch function,
+        ## such that sub-classes of the gene base types are also accepted.
+        create_base = next((_BASE_DISPATCH[type_] for type_ in type(base).__mro__
+                            if type_ in _BASE_DISPATCH), None)
+        if create_base is None:
+            raise TypeError(f"Unknown base; {base} of type {type(base)}. Expected one of: GeneBase, BitStringBaseTypes, str, list, tuple.")
+        self.__base: GeneBase = create_base(base)
     
     @property
     def chromosome_length(self) -> int:
@@ -260,6 +424,19 @@ class GeneticEncoder(Generic[ST], metaclass=ABCMeta):
     def evaluate_fitness(self, chromosome: CT) -> Real:
         """Return the fitness of the given chromosome."""
         raise NotImplementedError
+    
+    def evaluate_batch(self, population: npt.NDArray) -> npt.NDArray[np.float64]:
+        """
+        Return the fitness of each chromosome (row) of the given population as an array of floats.
+        
+        By default, this calls `evaluate_fitness` once per chromosome.
+        Sub-classes can override this to evaluate the whole population at once,
+        for example as a single vectorised expression over the population array,
+        or with a compiled kernel that loops over the rows in parallel.
+        If overridden, the genetic system evaluates through this method
+        instead of distributing chromosomes over its pool of workers.
+        """
+        return np.fromiter(map(self.evaluate_fitness, population), dtype=np.float64, count=len(population))
 
 
 
@@ -279,20 +456,66 @@ class GeneticRecombinator(metaclass=ABCMeta):
     In permutation recombinators, the offspring chromosomes must be permutations of the parents.
     In non-perfect permutation recombinators, the offspring chromosomes may not be valid solutions.
     
+    Sub-classes must override `recombine` to recombine a single pair of parents,
+    and may override `recombine_batch` to recombine many pairs in a single
+    vectorised operation, which by default recombines each pair individually.
+    
     See: https://en.wikipedia.org/wiki/Recombination_(genetic_algorithm)
     """
     
+    __slots__ = ("__generator",)
+    
+    def __init__(self, rng: Generator | int | None = None) -> None:
+        """
+        Super constructor for recombination operators.
+        
+        Parameters
+        ----------
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the recombinator to create its own, None generates a random seed.
+        """
+        self.__generator: Generator = default_rng(rng)
+    
+    @property
+    def generator(self) -> Generator:
+        """Get the random number generator used by the recombinator."""
+        return self.__generator
+    
     @abstractmethod
     def recombine(self, chromosome_1: CT, chromosome_2: CT) -> Iterable[CT]:
         raise NotImplementedError
+    
+    def recombine_batch(self, parents_1: npt.NDArray, parents_2: npt.NDArray) -> tuple[npt.NDArray, npt.NDArray]:
+        """
+        Recombine each pair of parents in the same rows of the given arrays.
+        
+        Returns two arrays of offspring, of the same shape as the parents,
+        where the offspring in each row are produced by the parents in that row.
+        """
+        offspring_1, offspring_2 = np.empty_like(parents_1), np.empty_like(parents_2)
+        for row, (parent_1, parent_2) in enumerate(zip(parents_1, parents_2)):
+            offspring_1[row], offspring_2[row] = self.recombine(parent_1, parent_2)
+        return (offspring_1, offspring_2)
 
 class PointCrossOver(GeneticRecombinator):
     def recombine(self, chromosome_1: CT, chromosome_2: CT) -> Iterable[CT]:
         ## Choose a sub-sequence (in the same place) using two "points", and swap them between the genes.
-        left_point = randint(0, len(chromosome_1))
-        right_point = randint(left_point, len(chromosome_1))
-        return ((chromosome_1[:left_point] + chromosome_2[left_point:right_point] + chromosome_1[right_point:]),
-                (chromosome_2[:left_point] + chromosome_1[left_point:right_point] + chromosome_2[right_point:]))
+        left_point = self.generator.integers(0, len(chromosome_1))
+        right_point = self.generator.integers(left_point, len(chromosome_1))
+        offspring_1, offspring_2 = chromosome_1.copy(), chromosome_2.copy()
+        offspring_1[left_point:right_point] = chromosome_2[left_point:right_point]
+        offspring_2[left_point:right_point] = chromosome_1[left_point:right_point]
+        return (offspring_1, offspring_2)
+    
+    def recombine_batch(self, parents_1: npt.NDArray, parents_2: npt.NDArray) -> tuple[npt.NDArray, npt.NDArray]:
+        """Recombine each pair of parents by swapping a sub-sequence between two points drawn for each pair."""
+        n_pairs, length = parents_1.shape
+        left_points = self.generator.integers(0, length, size=n_pairs)
+        right_points = self.generator.integers(left_points, length)
+        columns = np.arange(length)
+        mask = (columns >= left_points[:, np.newaxis]) & (columns < right_points[:, np.newaxis])
+        return (np.where(mask, parents_2, parents_1),
+                np.where(mask, parents_1, parents_2))
 
 class SplitCrossOver(GeneticRecombinator):
     """
@@ -300,27 +523,158 @@ class SplitCrossOver(GeneticRecombinator):
     """
     def recombine(self, chromosome_1: CT, chromosome_2: CT) -> Iterable[CT]:
         ## Split the genes in half with a sinlge "point" (in the same place), and swap the sub-sequences.
-        point: int = randint(0, len(chromosome_1))
-        return ((chromosome_1[:point] + chromosome_2[point:]),
-                (chromosome_2[:point] + chromosome_1[point:]))
+        point: int = self.generator.integers(0, len(chromosome_1))
+        offspring_1, offspring_2 = chromosome_1.copy(), chromosome_2.copy()
+        offspring_1[point:] = chromosome_2[point:]
+        offspring_2[point:] = chromosome_1[point:]
+        return (offspring_1, offspring_2)
+    
+    def recombine_batch(self, parents_1: npt.NDArray, parents_2: npt.NDArray) -> tuple[npt.NDArray, npt.NDArray]:
+        """Recombine each pair of parents by swapping the sub-sequences after a point drawn for each pair."""
+        n_pairs, length = parents_1.shape
+        points = self.generator.integers(0, length, size=n_pairs)
+        mask = np.arange(length) >= points[:, np.newaxis]
+        return (np.where(mask, parents_2, parents_1),
+                np.where(mask, parents_1, parents_2))
+
+def _random_mask(generator: Generator, shape: int | tuple[int, ...]) -> npt.NDArray[np.bool_]:
+    """
+    Return a boolean array of the given shape with each element true with probability one half.
+    
+    Eight elements are drawn from each random byte, which is much faster
+    than drawing each element with a separate bounded integer.
+    """
+    shape = np.atleast_1d(shape)
+    rows, length = int(np.prod(shape[:-1])), int(shape[-1])
+    return _random_bit_values(generator, 1, (rows, length)).view(np.bool_).reshape(shape)
 
 class UniformSwapper(GeneticRecombinator):
     def recombine(self, chromosome_1: CT, chromosome_2: CT) -> Iterable[CT]:
         """
         For each gene in the chromosomes, randomly select a gene from the first or the second gene, to build a new one.
         """
-        new_chromosome_1: list = []
-        new_chromosome_2: list = []
-        for chromosome_1, chromosome_2 in zip(chromosome_1, chromosome_2):
-            if randint(0, 2):
-                new_chromosome_1.append(chromosome_1)
-                new_chromosome_2.append(chromosome_2)
-            else:
-                new_chromosome_1.append(chromosome_2)
-                new_chromosome_2.append(chromosome_1)
-        if isinstance(chromosome_1, str):
-            return ("".join(new_chromosome_1), "".join(new_chromosome_2))
-        return new_chromosome_1, new_chromosome_2
+        ## Draw a mask choosing which parent each gene of the first offspring comes from,
+        ## the second offspring takes the gene from the other parent.
+        mask = _random_mask(self.generator, len(chromosome_1))
+        return (np.where(mask, chromosome_1, chromosome_2),
+                np.where(mask, chromosome_2, chromosome_1))
+    
+    def recombine_batch(self, parents_1: npt.NDArray, parents_2: npt.NDArray) -> tuple[npt.NDArray, npt.NDArray]:
+        """Recombine each pair of parents by choosing the parent of each gene with a single mask for all pairs."""
+        mask = _random_mask(self.generator, parents_1.shape)
+        return (np.where(mask, parents_1, parents_2),
+                np.where(mask, parents_2, parents_1))
+
+class PackedUniformSwapper(GeneticRecombinator):
+    """
+    Uniform swapper for chromosomes of the packed binary base.
+    
+    Each bit of a random 64-bit mask word chooses which parent a gene of
+    the first offspring comes from, such that a single bitwise operation
+    chooses the parents of 64 genes at once.
+    """
+    
+    def recombine(self, chromosome_1: npt.NDArray[np.uint64], chromosome_2: npt.NDArray[np.uint64]) -> Iterable[npt.NDArray[np.uint64]]:
+        """For each gene in the chromosomes, randomly select a gene from the first or the second gene, to build a new one."""
+        return self.recombine_batch(chromosome_1, chromosome_2)
+    
+    def recombine_batch(self, parents_1: npt.NDArray[np.uint64], parents_2: npt.NDArray[np.uint64]) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+        """Recombine each pair of parents by choosing the parent of each gene with a single mask for all pairs."""
+        mask = self.generator.integers(0, np.iinfo(np.uint64).max, size=parents_1.shape,
+                                       dtype=np.uint64, endpoint=True)
+        inverse_mask = ~mask
+        return ((mask & parents_1) | (inverse_mask & parents_2),
+                (mask & parents_2) | (inverse_mask & parents_1))
+
+## Masks of the bits of a 64-bit word at or above each index from 0 to 64 (inclusive).
+_HIGH_BITS_MASKS: npt.NDArray[np.uint64] = np.array([((1 << 64) - 1) ^ ((1 << index) - 1) for index in range(65)],
+                                                    dtype=np.uint64)
+
+def _packed_split_masks(points: npt.NDArray[np.int64], words: int) -> npt.NDArray[np.uint64]:
+    """
+    Return the masks of the genes at or after each of the given points of packed binary chromosomes of the given number of words.
+    
+    The mask word for each point and word is looked up by the index of the point relative to the
+    start of the word, clipped to the range [0, 64], such that no shifts are computed per word.
+    """
+    relative_points = points[:, np.newaxis] - (64 * np.arange(words))
+    return _HIGH_BITS_MASKS[np.clip(relative_points, 0, 64)]
+
+class PackedSplitCrossOver(GeneticRecombinator):
+    """
+    Split cross over for chromosomes of the packed binary base.
+    
+    Splits a pair of chromosomes into two sub-sequences in the same place, and swaps the pieces
+    between those chromosomes, by blending whole 64-bit words of the parents with a split mask.
+    """
+    
+    __slots__ = ("__base",)
+    
+    def __init__(self, base: PackedBitStringBase, rng: Generator | int | None = None) -> None:
+        """
+        Create a packed split cross over recombinator.
+        
+        Parameters
+        ----------
+        `base: PackedBitStringBase` - The packed binary base of the chromosomes to recombine.
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the recombinator to create its own, None generates a random seed.
+        """
+        super().__init__(rng)
+        self.__base: PackedBitStringBase = base
+    
+    def recombine(self, chromosome_1: npt.NDArray[np.uint64], chromosome_2: npt.NDArray[np.uint64]) -> Iterable[npt.NDArray[np.uint64]]:
+        """Split the chromosomes with a single point (in the same place), and swap the sub-sequences."""
+        offspring_1, offspring_2 = self.recombine_batch(chromosome_1[np.newaxis], chromosome_2[np.newaxis])
+        return (offspring_1[0], offspring_2[0])
+    
+    def recombine_batch(self, parents_1: npt.NDArray[np.uint64], parents_2: npt.NDArray[np.uint64]) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+        """Recombine each pair of parents by swapping the sub-sequences after a point drawn for each pair."""
+        points = self.generator.integers(0, self.__base.length, size=len(parents_1))
+        mask = _packed_split_masks(points, self.__base.words)
+        inverse_mask = ~mask
+        return ((inverse_mask & parents_1) | (mask & parents_2),
+                (inverse_mask & parents_2) | (mask & parents_1))
+
+class PackedPointCrossOver(GeneticRecombinator):
+    """
+    Point cross over for chromosomes of the packed binary base.
+    
+    Swaps a sub-sequence (in the same place) between two points of a pair of chromosomes,
+    by blending whole 64-bit words of the parents with the difference of two split masks.
+    """
+    
+    __slots__ = ("__base",)
+    
+    def __init__(self, base: PackedBitStringBase, rng: Generator | int | None = None) -> None:
+        """
+        Create a packed point cross over recombinator.
+        
+        Parameters
+        ----------
+        `base: PackedBitStringBase` - The packed binary base of the chromosomes to recombine.
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the recombinator to create its own, None generates a random seed.
+        """
+        super().__init__(rng)
+        self.__base: PackedBitStringBase = base
+    
+    def recombine(self, chromosome_1: npt.NDArray[np.uint64], chromosome_2: npt.NDArray[np.uint64]) -> Iterable[npt.NDArray[np.uint64]]:
+        """Choose a sub-sequence (in the same place) using two points, and swap it between the chromosomes."""
+        offspring_1, offspring_2 = self.recombine_batch(chromosome_1[np.newaxis], chromosome_2[np.newaxis])
+        return (offspring_1[0], offspring_2[0])
+    
+    def recombine_batch(self, parents_1: npt.NDArray[np.uint64], parents_2: npt.NDArray[np.uint64]) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+        """Recombine each pair of parents by swapping a sub-sequence between two points drawn for each pair."""
+        length, words = self.__base.length, self.__base.words
+        left_points = self.generator.integers(0, length, size=len(parents_1))
+        right_points = self.generator.integers(left_points, length)
+        mask = _packed_split_masks(left_points, words) & ~_packed_split_masks(right_points, words)
+        inverse_mask = ~mask
+        return ((inverse_mask & parents_1) | (mask & parents_2),
+                (inverse_mask & parents_2) | (mask & parents_1))
 
 
 
@@ -357,29 +711,69 @@ class GeneticMutator(metaclass=ABCMeta):
     bases differently, two seperate specialised methods can be overridden instead;
         - `numeric_mutate` any of the standard numeric 'bit-string' bases; binary, octal, hexadecimal,
         - `arbitrary_mutate` any other arbitrary base over some fixed alphabet,
+        - `packed_mutate` the packed binary base, whose chromosomes are arrays of 64-bit words,
     
     By default, these just call the standard mutate method.
     
     As such, to sub-class genetic mutator, one must override either;
         - the generic mutate method (and possibly any of the specialised mutate methods),
         - or both of the specialised mutatre methods and not the generic mutate method.
+    
+    Populations are mutated by the `mutate_rows` method, which by default mutates each
+    chosen chromosome individually. Sub-classes can override this to mutate all of the
+    chosen chromosomes of a population in a single vectorised operation.
     """
     
+    __slots__ = ("__generator",)
+    
+    def __init__(self, rng: Generator | int | None = None) -> None:
+        """
+        Super constructor for mutation operators.
+        
+        Parameters
+        ----------
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the mutator to create its own, None generates a random seed.
+        """
+        self.__generator: Generator = default_rng(rng)
+    
+    @property
+    def generator(self) -> Generator:
+        """Get the random number generator used by the mutator."""
+        return self.__generator
+    
+    def mutate_rows(self, population: npt.NDArray, rows: npt.NDArray[np.intp], base: GeneBase) -> npt.NDArray:
+        """
+        Mutate the chromosomes in the given rows of the population in-place.
+        
+        Rows may be repeated, in which case the chromosome is mutated multiple times.
+        """
+        mutate = (self.bitstring_mutate, self.numerical_mutate, self.arbitrary_mutate, self.packed_mutate)[base.tag]
+        ## Per-chromosome mutations are arbitrary Python methods, so cannot be compiled,
+        ## iterate over the rows as Python integers which index faster than numpy scalars.
+        for row in rows.tolist():
+            population[row] = mutate(population[row], base)
+        return population
+    
     def mutate(self, chromosome: CT, base: GeneBase) -> CT:
         """Mutate the given chromosome encoded in the given base."""
         return NotImplemented
     
-    def bitstring_mutate(self, chromosome: str, base: BitStringBase) -> str:
+    def bitstring_mutate(self, chromosome: npt.NDArray[np.uint8], base: BitStringBase) -> npt.NDArray[np.uint8]:
         """Mutate the given chromosome encoded in the given bit-string base."""
         return self.mutate(chromosome, base)
     
-    def numerical_mutate(self, chromosome: str, base: NumericalBase[NT]) -> list[NT]:
+    def numerical_mutate(self, chromosome: npt.NDArray, base: NumericalBase[NT]) -> npt.NDArray:
         """Mutate the given chromosome encoded in the given numeric base."""
         return self.mutate(chromosome, base)
     
-    def arbitrary_mutate(self, chromosome: list[Any], base: ArbitraryBase[GT]) -> list[GT]:
+    def arbitrary_mutate(self, chromosome: npt.NDArray, base: ArbitraryBase[GT]) -> npt.NDArray:
         """Mutate the given chromosome encoded in the given arbitrary base."""
         return self.mutate(chromosome, base)
+    
+    def packed_mutate(self, chromosome: npt.NDArray[np.uint64], base: PackedBitStringBase) -> npt.NDArray[np.uint64]:
+        """Mutate the given chromosome encoded in the given packed binary base."""
+        return self.mutate(chromosome, base)
 
 class PointMutator(GeneticMutator):
     """
@@ -393,29 +787,256 @@ class PointMutator(GeneticMutator):
     Point mutators are not appropriate for permutation problems, as they may commonly produce invalid solutions.
     """
     
-    def __init__(self, points: int) -> None:
+    def __init__(self, points: int, rng: Generator | int | None = None) -> None:
         """
         Insert the random new genes into the chromosome at random positions.
         
         Parameters
         ----------
         `points: int` - The number of genes in the chromosome to mutate.
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the mutator to create its own, None generates a random seed.
         """
         if not isinstance(points, int) or points < 1:
             raise ValueError("Number of points must be an integer greater than zero. "
                              f"Got; {points} of type {type(points)}.")
+        super().__init__(rng)
         self.__points: int = points
     
     def mutate(self, chromosome: CT, base: GeneBase) -> CT:
-        """Point mutate the given chromosome encoded in the given base."""
-        for index, gene in zip(randint(len(chromosome), size=self.__points), ## TODO: change to using generator, add generator to base class.
-                               base.random_genes(self.__points)):
-            chromosome[index] = gene
-            # chromosome = chromosome[:index] + gene + chromosome[index+1:]
-        return chromosome
+        """Point mutate the given chromosome encoded in the given base in-place."""
+        return self.mutate_rows(chromosome[np.newaxis], np.zeros(1, dtype=np.intp), base)[0]
     
-    def bitstring_mutate(self, chromosome: str, base: BitStringBase) -> str:
-        return "".join(self.mutate(list(chromosome), base))
+    def bitstring_mutate(self, chromosome: npt.NDArray[np.uint8], base: BitStringBase) -> npt.NDArray[np.uint8]:
+        """Point mutate the given chromosome encoded in the given bit-string base in-place."""
+        return self.mutate(chromosome, base)
+    
+    def prepare_generation(self,
+                           n_individuals: int,
+                           chromosome_length: int,
+                           base: GeneBase
+                           ) -> tuple[npt.NDArray[np.intp], npt.NDArray]:
+        """
+        Draw the positions and values of the points of a generation of mutations.
+        
+        Returns two arrays of shape `(n_individuals, points)`; the positions of the points
+        in each mutated chromosome, and the new values of the genes at those points.
+        For bit-string bases, the values are instead random non-zero offsets to add to the
+        genes modulo the number of values, such that every mutated gene changes value,
+        and in a binary base representation this simply flips the bits.
+        
+        For bit-string bases, both are drawn together in a single call, as the quotient and
+        remainder of a random integer over the product of the numbers of positions and offsets.
+        """
+        size: tuple[int, int] = (n_individuals, self.__points)
+        if base.tag == GeneBase.BITSTRING:
+            offsets: int = base.total_values - 1
+            positions, values = np.divmod(self.generator.integers(0, chromosome_length * offsets, size=size), offsets)
+            return (positions, (values + 1).astype(np.uint8))
+        positions = self.generator.integers(0, chromosome_length, size=size)
+        values = base.random_genes(n_individuals * self.__points, self.generator).reshape(size)
+        return (positions, values)
+    
+    def mutate_rows(self, population: npt.NDArray, rows: npt.NDArray[np.intp], base: GeneBase) -> npt.NDArray:
+        """
+        Point mutate the chromosomes in the given rows of the population in-place.
+        
+        The positions and values of all points are drawn in one call each, and written to the
+        population in a single indexed operation. Bit-string offsets are accumulated, such that
+        repeated rows, and points at the same gene, are each mutated multiple times.
+        """
+        if base.tag == GeneBase.PACKED:
+            ## Flip the bits of the chosen genes by exclusive-or with one-hot words,
+            ## accumulating over points in the same word of the same chromosome.
+            rows = np.repeat(rows, self.__points)
+            genes = self.generator.integers(0, base.length, size=rows.size, dtype=np.uint64)
+            one_hot = np.left_shift(np.uint64(1), genes % np.uint64(64))
+            np.bitwise_xor.at(population, (rows, (genes // np.uint64(64)).astype(np.intp)), one_hot)
+            return population
+        positions, values = self.prepare_generation(rows.size, population.shape[1], base)
+        rows, positions, values = np.repeat(rows, self.__points), positions.ravel(), values.ravel()
+        if base.tag == GeneBase.BITSTRING:
+            ## The number of values is a power of two, so the sums are reduced modulo it by masking.
+            np.add.at(population, (rows, positions), values)
+            population[rows, positions] &= np.uint8(base.total_values - 1)
+        else: population[rows, positions] = values
+        return population
+
+class UniformMutator(GeneticMutator):
+    """
+    A uniform mutator.
+    
+    Changes each gene in a chromosome to a different random value independently with a given probability,
+    such that the number of mutated genes varies between chromosomes.
+    
+    In a binary base representation, this simply flips each bit with the given probability.
+    
+    Uniform mutators are not appropriate for permutation problems, as they may commonly produce invalid solutions.
+    """
+    
+    __slots__ = ("__rate",
+                 "__dense_draws")
+    
+    def __init__(self, rate: float, rng: Generator | int | None = None) -> None:
+        """
+        Create a uniform mutator.
+        
+        Rates that are a power of a half greater than or equal to one sixteenth are mutated densely
+        for the packed binary base, by exclusive-or with the conjunction of random 64-bit words.
+        
+        Parameters
+        ----------
+        `rate: float` - The probability of mutating each gene, must be in the range (0.0, 1.0].
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the mutator to create its own, None generates a random seed.
+        """
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"Mutation rate must be in the range (0.0, 1.0]. Got; {rate=}.")
+        super().__init__(rng)
+        self.__rate: float = float(rate)
+        
+        ## The conjunction of n random words has each bit set with probability 1/2^n.
+        numerator, denominator = self.__rate.as_integer_ratio()
+        self.__dense_draws: Optional[int] = None
+        if numerator == 1 and denominator <= 16:
+            self.__dense_draws = denominator.bit_length() - 1
+    
+    @property
+    def rate(self) -> float:
+        """Get the probability of mutating each gene."""
+        return self.__rate
+    
+    def mutate(self, chromosome: CT, base: GeneBase) -> CT:
+        """Uniformly mutate the given chromosome encoded in the given base in-place."""
+        return self.mutate_rows(chromosome[np.newaxis], np.zeros(1, dtype=np.intp), base)[0]
+    
+    def mutate_rows(self, population: npt.NDArray, rows: npt.NDArray[np.intp], base: GeneBase) -> npt.NDArray:
+        """
+        Uniformly mutate the chromosomes in the given rows of the population in-place.
+        
+        The genes to mutate are drawn for all of the rows at once, and the mutations
+        are written to the population in a single indexed operation. Binary genes are
+        flipped by exclusive-or, and other genes are offset by non-zero amounts over the
+        indices of their values, such that every mutated gene changes value, and such
+        that mutations of repeated rows accumulate.
+        """
+        if base.tag == GeneBase.PACKED and self.__dense_draws is not None:
+            masks = np.full((rows.size, base.words), np.iinfo(np.uint64).max, dtype=np.uint64)
+            for _ in range(self.__dense_draws):
+                masks &= np.frombuffer(self.generator.bytes(masks.nbytes), dtype=np.uint64).reshape(masks.shape)
+            masks[:, -1] &= base.last_word_mask
+            np.bitwise_xor.at(population, rows, masks)
+            return population
+        length: int = base.length if base.tag == GeneBase.PACKED else population.shape[1]
+        mutated_rows, genes = self.__draw_genes(rows.size, length)
+        mutated_rows = rows[mutated_rows]
+        if base.tag == GeneBase.PACKED:
+            one_hot = np.left_shift(np.uint64(1), (genes % 64).astype(np.uint64))
+            np.bitwise_xor.at(population, (mutated_rows, genes // 64), one_hot)
+        elif base.tag == GeneBase.BITSTRING and base.bits == 1:
+            np.bitwise_xor.at(population, (mutated_rows, genes), np.uint8(1))
+        elif base.tag == GeneBase.BITSTRING:
+            ## Add random non-zero offsets modulo the number of values (a power of two),
+            ## accumulating over repeated rows, such that every mutated gene changes value.
+            offsets = self.generator.integers(1, base.total_values, size=genes.size, dtype=np.uint8)
+            np.add.at(population, (mutated_rows, genes), offsets)
+            population[mutated_rows, genes] &= np.uint8(base.total_values - 1)
+        else:
+            ## Add random non-zero offsets to the indices of the genes' values modulo the number
+            ## of values, accumulating over repeated rows, such that every mutated gene changes value.
+            if base.tag == GeneBase.NUMERICAL:
+                n_values: int = int(base.max_range - base.min_range) + 1
+            else: n_values: int = len(base.values)
+            if n_values < 2:
+                return population
+            length = population.shape[1]
+            flat_genes, inverse = np.unique(mutated_rows * length + genes, return_inverse=True)
+            offsets = np.zeros(flat_genes.size, dtype=np.intp)
+            np.add.at(offsets, inverse, self.generator.integers(1, n_values, size=genes.size, dtype=np.intp))
+            mutated_rows, genes = np.divmod(flat_genes, length)
+            if base.tag == GeneBase.NUMERICAL:
+                population[mutated_rows, genes] = (base.min_range
+                                                   + (population[mutated_rows, genes] - base.min_range + offsets) % n_values)
+            else:
+                indices = base.indices_of(population[mutated_rows, genes])
+                population[mutated_rows, genes] = base.values_array[(indices + offsets) % n_values]
+        return population
+    
+    def __draw_genes(self, n_rows: int, length: int) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """
+        Draw the genes to mutate of the given number of chromosomes of the given length,
+        returning the row and gene indices of the mutations.
+        
+        Each gene is mutated independently with probability equal to the rate, this is
+        done by drawing the total number of mutations from a binomial distribution, and
+        then choosing that many distinct genes, such that the cost is proportional to
+        the number of mutations instead of the total number of genes.
+        """
+        total_genes: int = n_rows * length
+        n_mutations: int = self.generator.binomial(total_genes, self.__rate)
+        flat_genes = self.generator.choice(total_genes, n_mutations, replace=False, shuffle=False)
+        return np.divmod(flat_genes.astype(np.intp), length)
+
+class GaussianMutator(GeneticMutator):
+    """
+    A Gaussian (or creep) mutator.
+    
+    Perturbs every gene of a chromosome by adding normally distributed noise, with a standard
+    deviation proportional to the range of the base, and clipping the genes to the range.
+    Genes of integer numerical bases are perturbed by the noise rounded to the nearest integer.
+    
+    A small step size gives a local search around the existing chromosomes, which is useful
+    for fine-tuning the best solutions late in the search.
+    
+    Gaussian mutators are only applicable to numerical bases.
+    """
+    
+    __slots__ = ("__step_size",)
+    
+    def __init__(self, step_size: float, rng: Generator | int | None = None) -> None:
+        """
+        Create a Gaussian mutator.
+        
+        Parameters
+        ----------
+        `step_size: float` - The standard deviation of the noise as a fraction of the range of the base,
+        must be greater than zero.
+        
+        `rng: Generator | int | None` - Either an random number generator instance,
+        or a seed for the mutator to create its own, None generates a random seed.
+        """
+        if step_size <= 0.0:
+            raise ValueError(f"Step size must be greater than zero. Got; {step_size=}.")
+        super().__init__(rng)
+        self.__step_size: float = float(step_size)
+    
+    @property
+    def step_size(self) -> float:
+        """Get the standard deviation of the noise as a fraction of the range of the base."""
+        return self.__step_size
+    
+    def mutate(self, chromosome: CT, base: GeneBase) -> CT:
+        """Gaussian mutate the given chromosome encoded in the given base in-place."""
+        return self.mutate_rows(chromosome[np.newaxis], np.zeros(1, dtype=np.intp), base)[0]
+    
+    def mutate_rows(self, population: npt.NDArray, rows: npt.NDArray[np.intp], base: GeneBase) -> npt.NDArray:
+        """
+        Gaussian mutate the chromosomes in the given rows of the population in-place.
+        
+        The noise for all of the rows is drawn in one call, and added to the population
+        in a single indexed operation, accumulating over repeated rows.
+        """
+        if base.tag != GeneBase.NUMERICAL:
+            raise TypeError(f"Gaussian mutation requires a numerical base. Got; base of type {type(base)}.")
+        scale: float = self.__step_size * (base.max_range - base.min_range)
+        noise = self.generator.normal(0.0, scale, size=(rows.size, *population.shape[1:]))
+        if np.issubdtype(population.dtype, np.integer):
+            noise = np.rint(noise).astype(population.dtype)
+        np.add.at(population, rows, noise)
+        population[rows] = np.clip(population[rows], base.min_range, base.max_range)
+        return population
 
 class SwapMutator(GeneticMutator):
     """
@@ -464,6 +1085,11 @@ class GeneticSelector(metaclass=ABCMeta):
         - A select method of selecting a subset of a population of candidate solutions
           to be used for culling and reproduction to generate the next generation,
         - A scale method of scaling the fitness of the candidate solutions in the population.
+    
+    Sub-classes implement selection by overriding `select_indices`, which samples
+    integer indices into the population from its fitness values alone. The selected
+    chromosomes and their fitness values are then gathered by indexing the population
+    array and fitness vector, rather than by sampling from a sequence of Python objects.
     """
     
     __slots__ = ("__requires_sorted",
@@ -495,23 +1121,33 @@ class GeneticSelector(metaclass=ABCMeta):
         """Get the random number generator used by the selector."""
         return self.__generator
     
-    @abstractmethod
     def select(self,
-               population: list[CT],
-               fitness: list[Real],
+               population: npt.NDArray,
+               fitness: npt.ArrayLike,
                quantity: int
-               ) -> list[CT]:
-        """Select the given number of chromosomes from the population."""
+               ) -> tuple[npt.NDArray, npt.NDArray[np.float64]]:
+        """Select the given number of chromosomes from the population, returning the selected chromosomes and their fitness values."""
+        self.validate(population, fitness, quantity)
+        fitness = np.asarray(fitness, dtype=np.float64)
+        indices: npt.NDArray[np.intp] = self.select_indices(fitness, quantity)
+        return (np.asarray(population)[indices], fitness[indices])
+    
+    @abstractmethod
+    def select_indices(self,
+                       fitness: npt.NDArray[np.float64],
+                       quantity: int
+                       ) -> npt.NDArray[np.intp]:
+        """Select the indices of the given number of chromosomes from a population with the given fitness values."""
         ...
     
     def scale(self,
-              fitness: list[Real]
-              ) -> list[Real]:
+              fitness: npt.NDArray[np.float64]
+              ) -> npt.NDArray[np.float64]:
         """Scale the given fitness values."""
         return fitness
     
     @staticmethod
-    def validate(population: list[CT], fitness: list[Real], quantity: int) -> None:
+    def validate(population: npt.NDArray, fitness: npt.ArrayLike, quantity: int) -> None:
         """Validate arguments for the selection operator."""
         if len(population) != len(fitness):
             raise ValueError("Population and fitness values must be the same length.")
@@ -519,19 +1155,75 @@ class GeneticSelector(metaclass=ABCMeta):
             raise ValueError("Quantity of chromosomes to select must be greater than zero.")
 
 class ProportionateSelector(GeneticSelector):
-    """Selects chromosomes from a population with probability proportionate to fitness with replacement."""
+    """
+    Selects chromosomes from a population with probability proportionate to fitness with replacement.
+    
+    Proportionate selection is sensitive to the scale and shift of the fitness values,
+    such that selection pressure is lost when the fitness values are similar relative to
+    their magnitude, and can be controlled by scaling the fitness values before selection;
+        - Sigma scaling subtracts the mean minus a multiple of the standard deviation of
+          the fitness values, clipping at zero, such that selection pressure depends only
+          on the spread of the fitness values relative to their mean,
+        - Linear rank scaling replaces each fitness value with a linear function of its rank,
+          from `2 - scaling_factor` for the lowest to `scaling_factor` for the highest fitness,
+          such that selection pressure is fixed regardless of the fitness values.
+    """
     
-    def __init__(self) -> None:
-        """Create a new proportionate selector."""
+    def __init__(self,
+                 scaling: Optional[Literal["sigma", "rank"]] = None,
+                 scaling_factor: float = 2.0
+                 ) -> None:
+        """
+        Create a new proportionate selector.
+        
+        Parameters
+        ----------
+        `scaling: {"sigma" | "rank" | None} = None` - The scaling to apply to the fitness values,
+        None applies no scaling.
+        
+        `scaling_factor: float = 2.0` - For sigma scaling, the multiple of the standard deviation
+        below the mean at which fitness is clipped to zero. For rank scaling, the expected number
+        of times the highest fitness chromosome is selected per population size, in the range [1.0, 2.0].
+        """
+        if scaling not in (None, "sigma", "rank"):
+            raise ValueError(f"Unknown scaling; {scaling}. Expected one of: 'sigma', 'rank', None.")
+        if scaling == "sigma" and scaling_factor <= 0.0:
+            raise ValueError(f"Sigma scaling factor must be greater than zero. Got; {scaling_factor=}.")
+        if scaling == "rank" and not 1.0 <= scaling_factor <= 2.0:
+            raise ValueError(f"Rank scaling factor must be in the range [1.0, 2.0]. Got; {scaling_factor=}.")
         super().__init__(requires_sorted=False)
-    
-    def select(self,
-               population: list[CT],
-               fitness: list[Real],
-               quantity: int
-               ) -> list[CT]:
-        """Select a given quantity of chromosomes from the population with probability proportionate to fitness with replacement."""
-        return tuple(getitem_zip(self.generator.choice(getitem_zip(population, fitness), quantity, p=fitness)))
+        self.__scaling: Optional[Literal["sigma", "rank"]] = scaling
+        self.__scaling_factor: float = float(scaling_factor)
+    
+    def scale(self, fitness: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Scale the given fitness values according to the selector's scaling scheme."""
+        if self.__scaling is None:
+            return fitness
+        if self.__scaling == "sigma":
+            std: float = fitness.std()
+            if std == 0.0:
+                return np.ones_like(fitness)
+            return np.maximum(fitness - (fitness.mean() - self.__scaling_factor * std), 0.0)
+        if len(fitness) == 1:
+            return np.ones_like(fitness)
+        ## Linear ranking, where the ranks are the positions in ascending order of fitness.
+        ranks = np.empty_like(fitness)
+        ranks[np.argsort(fitness)] = np.arange(len(fitness), dtype=np.float64)
+        eta_minus: float = 2.0 - self.__scaling_factor
+        return eta_minus + ((self.__scaling_factor - eta_minus) / (len(fitness) - 1)) * ranks
+    
+    def select_indices(self,
+                       fitness: npt.NDArray[np.float64],
+                       quantity: int
+                       ) -> npt.NDArray[np.intp]:
+        """
+        Select the indices of a given quantity of chromosomes with probability proportionate to fitness with replacement.
+        
+        Raises a ValueError if any fitness value is negative or not finite, or if all of them are zero.
+        """
+        cdf = np.cumsum(fitness)
+        _check_weights(fitness, cdf[-1])
+        return _sample_cdf(self.generator, cdf, quantity)
 
 class RankedSelector(GeneticSelector):
     """Selects chromosomes from a population with probability proportionate to fitness rank with replacement."""
@@ -540,16 +1232,62 @@ class RankedSelector(GeneticSelector):
         """Create a new ranked selector."""
         super().__init__(requires_sorted=True)
     
-    def select(self,
-               population: list[CT],
-               fitness: list[Real],
-               quantity: int
-               ) -> list[CT]:
-        """Select a given quantity of chromosomes from the population with probability proportionate to fitness rank with replacement."""
-        pop_size: int = len(population)
-        rank_sum: float = (pop_size + 1) * (pop_size / 2.0) 
-        ranks: list[Fraction] = [Fraction(i / rank_sum) for i in range(pop_size)]
-        return tuple(getitem_zip(self.generator.choice(getitem_zip(population, fitness), quantity, p=ranks)))
+    def select_indices(self,
+                       fitness: npt.NDArray[np.float64],
+                       quantity: int
+                       ) -> npt.NDArray[np.intp]:
+        """Select the indices of a given quantity of chromosomes with probability proportionate to fitness rank with replacement."""
+        return _sample_cdf(self.generator, _rank_cdf(len(fitness)), quantity)
+    
+    @staticmethod
+    def rank_probabilities(pop_size: int) -> npt.NDArray[np.float64]:
+        """
+        Get the selection probabilities of a population of the given size sorted in ascending order of fitness.
+        
+        The lowest fitness chromosome has rank one and the highest has rank equal
+        to the population size, the probabilities are the ranks over their sum.
+        
+        The probabilities are cached by population size, since it rarely changes
+        between generations, and the returned array is therefore read-only.
+        """
+        return _rank_probabilities(pop_size)
+
+@functools.lru_cache(maxsize=8)
+def _rank_probabilities(pop_size: int) -> npt.NDArray[np.float64]:
+    """Return a read-only array of the ranked selection probabilities of a population of the given size."""
+    rank_sum: float = (pop_size + 1) * (pop_size / 2.0)
+    ranks: npt.NDArray[np.float64] = np.arange(1, pop_size + 1, dtype=np.float64)
+    ranks /= rank_sum
+    ranks.setflags(write=False)
+    return ranks
+
+@functools.lru_cache(maxsize=8)
+def _rank_cdf(pop_size: int) -> npt.NDArray[np.float64]:
+    """Return a read-only array of the cumulative ranks of a population of the given size."""
+    ranks: npt.NDArray[np.float64] = np.arange(1, pop_size + 1, dtype=np.float64)
+    cdf: npt.NDArray[np.float64] = np.cumsum(ranks)
+    cdf.setflags(write=False)
+    return cdf
+
+def _check_weights(weights: npt.NDArray[np.float64], total: float) -> None:
+    """Check that the given weights with the given total are a valid (unnormalised) probability distribution."""
+    if not np.isfinite(total) or weights.min() < 0.0:
+        raise ValueError("Fitness values for proportionate selection must be finite and non-negative. "
+                         f"Got; minimum={weights.min()}, total={total}.")
+    if total <= 0.0:
+        raise ValueError(f"Fitness values for proportionate selection must have a positive total. Got; total={float(total)}.")
+
+def _sample_cdf(generator: Generator,
+                cdf: npt.NDArray[np.float64],
+                quantity: int
+                ) -> npt.NDArray[np.intp]:
+    """
+    Sample a given quantity of indices with replacement from an unnormalised cumulative distribution.
+    
+    Each uniform draw is scaled by the total and located in the distribution by binary search,
+    such that entries of zero weight (such as zero fitness chromosomes) are never selected.
+    """
+    return cdf.searchsorted(generator.random(quantity) * cdf[-1], side="right")
 
 class TournamentSelector(GeneticSelector):
     """
@@ -579,26 +1317,81 @@ class TournamentSelector(GeneticSelector):
         if not n_chosen < tournamenet_size:
             raise ValueError("Number of chosen chromosomes must be less than the tournament size. "
                              f"Got; {tournamenet_size=}, {n_chosen=}.")
-        super().__init__(requires_sorted=(inner_selector is None or inner_selector.requires_sorted))
+        ## Tournaments are ordered internally, so the population never needs to be sorted.
+        super().__init__(requires_sorted=False)
         self.__tournament_size: int = tournamenet_size
         self.__n_chosen: int = n_chosen
         self.__inner_selector: ProportionateSelector | RankedSelector | None = inner_selector
+        
+        ## The rank probabilities depend only on the tournament size,
+        ## so are computed once rather than for every tournament.
+        self.__rank_probabilities: Optional[npt.NDArray[np.float64]] = None
+        if isinstance(inner_selector, RankedSelector):
+            self.__rank_probabilities = inner_selector.rank_probabilities(tournamenet_size)
     
-    def select(self, population: list[CT], fitness: list[Real], quantity: int) -> list[CT]:
+    def select_indices(self,
+                       fitness: npt.NDArray[np.float64],
+                       quantity: int
+                       ) -> npt.NDArray[np.intp]:
         """
-        Select a given quantity of chromosomes from the population by pitching them against each other in tournaments.
+        Select the indices of a given quantity of chromosomes by pitching them against each other in tournaments.
         
         Chromosomes selected for tournamenets are selected with uniform probability with replacement.
+        Each tournament has multiple winners if the number chosen is greater than one, so only enough
+        tournaments are run to select the given quantity, and any excess winners of the last are discarded.
         """
-        tournaments = chunk(self.generator.choice(getitem_zip(population, fitness),
-                                                  self.__tournament_size * quantity),
-                            self.__tournament_size, quantity, as_type=True)
+        n_tournaments: int = -(-quantity // self.__n_chosen)
+        return self.__tournament_winners(fitness, n_tournaments)[:quantity]
+    
+    def __tournament_winners(self,
+                             fitness: npt.NDArray[np.float64],
+                             n_tournaments: int
+                             ) -> npt.NDArray[np.intp]:
+        """Return the indices of the winners of the given number of tournaments, with the winners of each tournament contiguous."""
+        ## Each row is a tournament of indices into the population,
+        ## drawn for all tournaments in a single call to the generator.
+        tournaments: npt.NDArray[np.intp] = self.generator.integers(0, len(fitness),
+                                                                    (n_tournaments, self.__tournament_size))
+        tournament_fitness: npt.NDArray[np.float64] = fitness[tournaments]
+        
+        ## The winners of each tournament are its highest fitness chromosomes,
+        ## partitioned to the end of each tournament in linear time.
         if self.__inner_selector is None:
-            winner_lists = (max_n(tournament, n=self.__n_chosen, key=lambda x: x[1]) for tournament in tournaments)
-        winner_lists = (self.__inner_selector.select(*zip(tournament), quantity=self.__n_chosen) for tournament in tournaments)
-        return list(itertools.chain.from_iterable(winner_lists))
-    
-    def scale(self, fitness: list[Real]) -> list[Real]:
+            if self.__n_chosen == 1:
+                return tournaments[np.arange(n_tournaments), tournament_fitness.argmax(axis=1)]
+            top = np.argpartition(tournament_fitness, -self.__n_chosen, axis=1)[:, -self.__n_chosen:]
+            return np.take_along_axis(tournaments, top, axis=1).ravel()
+        
+        ## Order each tournament by ascending fitness, and draw ranked
+        ## positions within the tournaments for all winners at once.
+        if self.__rank_probabilities is not None:
+            order = np.argsort(tournament_fitness, axis=1)
+            positions = self.generator.choice(self.__tournament_size,
+                                              (n_tournaments, self.__n_chosen),
+                                              p=self.__rank_probabilities)
+            winners = np.take_along_axis(tournaments, np.take_along_axis(order, positions, axis=1), axis=1)
+            return winners.ravel()
+        
+        ## Draw proportionate positions within the tournaments for all winners at once,
+        ## by counting the entries of each tournament's cumulative fitness at or below each draw,
+        ## which is cheaper than a binary search per tournament, since tournaments are small.
+        if isinstance(self.__inner_selector, ProportionateSelector):
+            if not np.isfinite(fitness).all() or fitness.min() < 0.0:
+                raise ValueError("Fitness values for proportionate selection must be finite and non-negative. "
+                                 f"Got; minimum={fitness.min()}.")
+            cdf = np.cumsum(tournament_fitness, axis=1)
+            draws = self.generator.random((n_tournaments, self.__n_chosen)) * cdf[:, -1:]
+            positions = (cdf[:, np.newaxis, :] <= draws[:, :, np.newaxis]).sum(axis=2)
+            np.minimum(positions, self.__tournament_size - 1, out=positions)
+            return np.take_along_axis(tournaments, positions, axis=1).ravel()
+        
+        ## Otherwise, select the winners of each tournament with the inner selector.
+        winner_lists = (tournament[self.__inner_selector.select_indices(fitness_values, self.__n_chosen)]
+                        for tournament, fitness_values in zip(tournaments, tournament_fitness))
+        return np.fromiter(itertools.chain.from_iterable(winner_lists),
+                           dtype=np.intp, count=n_tournaments * self.__n_chosen)
+    
+    def scale(self, fitness: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """Scale the given fitness values, by default calling the inner selector's scale method."""
         if self.__inner_selector is not None:
             return self.__inner_selector.scale(fitness)
@@ -631,16 +1424,48 @@ class TournamentSelector(GeneticSelector):
 
 @dataclasses.dataclass(frozen=True)
 class GeneticAlgorithmSolution:
-    """A solution to a genetic algorithm."""
+    """
+    A solution to a genetic algorithm.
+    
+    The final population and its fitness values are sorted in ascending order of fitness,
+    such that the highest fitness individuals occur last.
+    """
     
     best_individual: CT
-    best_fitness: Fraction
-    population: list[CT] ## TODO Order the population such that the highest fitness individuals occur first.
-    fitness_values: list[Fraction]
+    best_fitness: float
+    population: npt.NDArray
+    fitness_values: npt.NDArray[np.float64]
     max_fitness_reached: bool = False
     max_generations_reached: bool = False
     stagnation_limit_reached: bool = False
 
+def _exact_fraction(factor: Real) -> Fraction:
+    """
+    Return the given factor as a fraction.
+    
+    Floats (including numpy floats) are converted from their shortest decimal representation,
+    such that decimal factors like `0.1` (which are not exactly representable) are exactly one tenth.
+    This is relatively slow, so factors should be converted once, outside of loops.
+    """
+    if isinstance(factor, (float, np.floating)):
+        return Fraction(str(factor))
+    return Fraction(factor)
+
+def _ceil_multiple(quantity: int, factor: Real) -> int:
+    """
+    Return `ceil(quantity * factor)` computed exactly with integer arithmetic.
+    
+    The factor is split into its integer ratio, such that fraction factors avoid the
+    cost of rational arithmetic, and float factors avoid rounding errors in the product.
+    """
+    numerator, denominator = factor.as_integer_ratio()
+    return -(-quantity * numerator // denominator)
+
+def _floor_multiple(quantity: int, factor: Real) -> int:
+    """Return `floor(quantity * factor)` computed exactly with integer arithmetic."""
+    numerator, denominator = factor.as_integer_ratio()
+    return quantity * numerator // denominator
+
 class GeneticSystem:
     """
     A genetic system.
@@ -715,36 +1540,145 @@ class GeneticSystem:
     
     __slots__ = (## Functions defining the system's genetic operators.
                  "__encoder",
+                 "__selector",
                  "__recombinator",
                  "__mutator",
-                 "__random_generator")
+                 "__mutate_rows",
+                 "__random_generator",
+                 
+                 ## Variables for parallel fitness evaluation.
+                 "__batch_evaluation",
+                 "__workers",
+                 "__pool",
+                 
+                 ## Variables for caching fitness values.
+                 "__fitness_cache",
+                 "__cache_size",
+                 
+                 ## The floating point type of fitness values.
+                 "__fitness_dtype")
     
     def __init__(self,
                  encoder: GeneticEncoder,
                  selector: GeneticSelector,
                  recombinator: GeneticRecombinator,
-                 mutator: GeneticMutator
+                 mutator: GeneticMutator,
+                 workers: Optional[int] = None,
+                 evaluator_backend: Literal["serial", "thread", "process"] = "process",
+                 cache_size: Optional[int | float] = None,
+                 fitness_dtype: Type[np.float32] | Type[np.float64] = np.float64
                  ) -> None:
+        """
+        Create a genetic system from a set of genetic operators.
+        
+        If `workers` is given and greater than one, then fitness evaluation
+        is distributed over a pool of that many workers, of the type given
+        by `evaluator_backend`. This is worthwhile only if the encoder's
+        fitness evaluation function is expensive, and the encoder does not
+        override `evaluate_batch` (in which case the pool is not used);
+            - A process pool suits pure Python fitness functions,
+              but the encoder must be picklable,
+            - A thread pool avoids the cost of inter-process communication,
+              but only runs in parallel for fitness functions that release
+              the GIL (e.g. those that spend their time in numpy or compiled
+              extensions), or on free-threaded builds of Python,
+            - The serial backend never uses a pool, regardless of the workers.
+        The pool is shut down by `close`, or on leaving a `with` block over the system.
+        
+        If `cache_size` is given and not None, then the fitness values of up to
+        that many distinct chromosomes are cached, and identical chromosomes
+        (such as elites that survive between generations, or children that are
+        copies of their parents) are not re-evaluated. The least recently
+        evaluated chromosomes are evicted first. A good size is a small multiple
+        of the maximum population size. If `cache_size` is infinite (`math.inf`),
+        then the cache is unbounded, and the bookkeeping of the order in which
+        chromosomes were evaluated is skipped, this suits problems with small
+        search spaces. The encoder's fitness evaluation function must be
+        deterministic for caching to be valid.
+        
+        The `fitness_dtype` is the floating point type of the arrays of fitness values
+        that are biased, scaled, sorted and selected from in every generation. Single
+        precision (`numpy.float32`) halves the memory traffic of these operations, and
+        suffices for most problems, but fitness values that differ by less than about
+        one part in ten million are then indistinguishable.
+        """
+        self.__pool: Optional[Executor] = None
         
         self.__encoder: GeneticEncoder = encoder
         self.__selector: GeneticSelector = selector
         self.__recombinator: GeneticRecombinator = recombinator
         self.__mutator: GeneticMutator = mutator
         
+        ## The encoder's base is constant for the system, so bind it to the mutator once,
+        ## instead of resolving it through the encoder every generation.
+        self.__mutate_rows: Callable[[npt.NDArray, npt.NDArray[np.intp]], npt.NDArray]
+        self.__mutate_rows = functools.partial(mutator.mutate_rows, base=encoder.base)
+        
         self.__random_generator: Generator = default_rng()
+        
+        if fitness_dtype not in (np.float32, np.float64):
+            raise ValueError(f"Fitness type must be either numpy.float32 or numpy.float64. Got; {fitness_dtype=}.")
+        self.__fitness_dtype: Type[np.float32] | Type[np.float64] = fitness_dtype
+        
+        ## Encoders that override batch evaluation handle their own parallelism.
+        self.__batch_evaluation: bool = type(encoder).evaluate_batch is not GeneticEncoder.evaluate_batch
+        
+        ## The pool of workers is created once and reused for every
+        ## generation, to avoid the cost of repeatedly spawning workers.
+        self.__workers: Optional[int] = workers
+        if workers is not None and workers > 1:
+            if evaluator_backend == "process":
+                self.__pool = ProcessPoolExecutor(max_workers=workers)
+            elif evaluator_backend == "thread":
+                self.__pool = ThreadPoolExecutor(max_workers=workers)
+            elif evaluator_backend != "serial":
+                raise ValueError(f"Unknown evaluator backend; {evaluator_backend}. "
+                                 "Expected one of: 'serial', 'thread', 'process'.")
+        
+        ## Fitness values keyed by the raw bytes of chromosomes,
+        ## ordered from least to most recently evaluated.
+        self.__fitness_cache: Optional[dict[bytes, float]] = None
+        self.__cache_size: Optional[int | float] = cache_size
+        if cache_size is not None:
+            if cache_size < 1 or (cache_size != math.inf and cache_size != int(cache_size)):
+                raise ValueError(f"Cache size must be an integer of at least one or infinite. Got; {cache_size=}.")
+            self.__fitness_cache = {}
+    
+    def __enter__(self) -> "GeneticSystem":
+        """Enter a context in which the system's pool of workers (if any) is kept alive."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Shut down the system's pool of workers (if any) on leaving the context."""
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Shut down the pool of workers if it exists, waiting for any pending evaluations to finish.
+        
+        Fitness evaluation is serial after the system is closed.
+        """
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=True)
+            self.__pool = None
+    
+    def __del__(self) -> None:
+        """Shut down the pool of workers if it exists."""
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False)
     
     @staticmethod
-    def linear_decay(diversity_bias: Fraction, decay: Fraction) -> Fraction:
+    def linear_decay(diversity_bias: float, decay: float) -> float:
         "Decay according to: `max(0.0, initial_diversity_bias - ((1.0 - bias_decay) * generation))`."
         return max(0.0, diversity_bias - decay)
     
     @staticmethod
-    def polynomial_decay(diversity_bias: Fraction, decay: Fraction) -> Fraction:
+    def polynomial_decay(diversity_bias: float, decay: float) -> float:
         "Decay according to: `initial_diversity_bias ^ (generation / (1.0 - bias_decay))`."
         return diversity_bias ** (1.0 / (1.0 - decay))
     
     @staticmethod
-    def exponential_decay(diversity_bias: Fraction, decay: Fraction) -> Fraction:
+    def exponential_decay(diversity_bias: float, decay: float) -> float:
         ## - Diversity bias reduces logarithmically in generations:
         ##  - diversity_bias_at_generation = initial_diversity_bias * ((1 - bias_decay) ^ generation), (equivalent to initial_diversity_bias * (e ^ (decay_constant * generation)) where decay contant is some large negative number)
         ##  - reaches to zero in the limit to infinity
@@ -755,10 +1689,13 @@ class GeneticSystem:
         return diversity_bias * (1.0 - decay)
     
     @staticmethod
-    def get_decay_function(decay_type: "DecayType" | Literal["lin", "pol", "exp"]) -> Callable[[Fraction, Fraction], Fraction]:
-        if isinstance(decay_type, DecayType):
-            return decay_type.value[0]
-        return DecayType[decay_type].value[0]
+    def get_decay_function(decay_type: Callable[[float, float], float] | Literal["lin", "pol", "exp"]) -> Callable[[float, float], float]:
+        """Get the decay function of the given name, or the given decay function itself, e.g. `DecayType.lin`."""
+        if isinstance(decay_type, str):
+            if decay_type not in ("lin", "pol", "exp"):
+                raise ValueError(f"Decay type must be one of 'lin', 'pol' or 'exp'. Got; {decay_type=}.")
+            return getattr(DecayType, decay_type)
+        return decay_type
     
     def set_operators(self) -> None:
         ...
@@ -782,10 +1719,10 @@ class GeneticSystem:
             
             survival_factor: Fraction, 
             # survival_factor_rate: Optional[Fraction],
-            # survival_factor_rate_type: Optional["DecayType" | Literal["lin", "pol", "exp"]],
+            # survival_factor_rate_type: Optional[Callable[[float, float], float] | Literal["lin", "pol", "exp"]],
             survival_elitism_factor: Optional[Fraction], ## Fraction of the surviving that are the elite.
             # survival_elitism_growth: Optional[Fraction],
-            # survival_elitism_growth_type: Optional["DecayType" | Literal["lin", "pol", "exp"]],
+            # survival_elitism_growth_type: Optional[Callable[[float, float], float] | Literal["lin", "pol", "exp"]],
             ## survival_filter: Optional[Callable[[Chromosome, Fraction, dict[str, Fraction], Fraction], bool]] = None,
             ##      - Function: (individual, fitness, fitness_statisitcs: statistic_name -> statistic, fitness_threshold) -> survived
             ## Common filters are to choose those x% above the mean or median, or to choose only those within x% of the fitness threshold.
@@ -793,26 +1730,26 @@ class GeneticSystem:
             replacement: bool,
             reproduction_elitism_factor: Fraction,
             reproduction_elitism_growth: Fraction,
-            reproduction_elitism_growth_type: Optional["DecayType" | Literal["lin", "pol", "exp"]],
+            reproduction_elitism_growth_type: Optional[Callable[[float, float], float] | Literal["lin", "pol", "exp"]],
             
-            mutation_factor: Fraction,
-            mutation_factor_growth: Fraction,
-            mutation_factor_growth_type: Optional["DecayType" | Literal["lin", "pol", "exp"]],
+            mutation_factor: float | Fraction,
+            mutation_factor_growth: float | Fraction,
+            mutation_factor_growth_type: Optional[Callable[[float, float], float] | Literal["lin", "pol", "exp"]],
             mutation_distribution: Literal["uniform", "half_logistic", "trunc_exponential"],
             mutation_step_size: Fraction,
             mutation_step_size_decay: Fraction,
-            mutation_step_size_decay_type: Optional["DecayType" | Literal["lin", "pol", "exp"]],
+            mutation_step_size_decay_type: Optional[Callable[[float, float], float] | Literal["lin", "pol", "exp"]],
             
             max_generations: Optional[int],
-            fitness_threshold: Optional[Fraction],
+            fitness_threshold: Optional[float],
             fitness_proportion: Optional[Fraction | int],
             stagnation_limit: Optional[int | Fraction],
             stagnation_proportion: Optional[Fraction | int] = 0.10, ## TODO Could use numpy.allclose
             
             ## These are used only for proportional fitness
-            diversity_bias: Optional[Fraction] = Fraction(0.95),
-            diversity_bias_decay: Optional[int | Fraction] = 100,
-            diversity_bias_decay_type: "DecayType" | Literal["lin", "pol", "exp", "hl-exp"] = "exp" # ["threshold-converge", "stagnation-diverge"]
+            diversity_bias: Optional[float | Fraction] = 0.95,
+            diversity_bias_decay: Optional[int | float | Fraction] = 100,
+            diversity_bias_decay_type: Callable[[float, float], float] | Literal["lin", "pol", "exp", "hl-exp"] = "exp" # ["threshold-converge", "stagnation-diverge"]
             ##      - converge towards fitness threshold - proportional to difference between mean fitness and fitness threshold,
             ##      - converge on rate of change towards fitness threshold,
             ##      - diverge on stagnation on best fittest towards fitness threshold. Increase proportional to diversity_bias * (stagnated_generations / stagnation_limit). This should try to explore around the solution space when the best fitness gets stuck on a local minima.
@@ -848,7 +1785,7 @@ class GeneticSystem:
         
         `max_generations: Optional[int]` -
         
-        `fitness_threshold: Optional[Fraction]` -
+        `fitness_threshold: Optional[float]` -
         
         `fitness_proportion: Optional[Fraction | int]` - Return if the average fitness of the best fitness fraction of the population is above the fitness threshold.
         
@@ -893,29 +1830,57 @@ class GeneticSystem:
                                 f"Got; {stagnation_limit=} of type {type(stagnation_limit)} and {max_generations=} of {type(max_generations)}.")
             stagnation_limit = int(stagnation_limit * max_generations)
         
-        population: list[CT] = self.create_population(init_pop_size)
-        fitness_values: list[Fraction] = [self.__encoder.evaluate_fitness(individual)
-                                          for individual in population]
-        
-        ## If elitism is enabled for either selection or mutation then the population and their fitness values need to be ordered.
+        ## The biases and mutation factor are updated every generation by the decay functions,
+        ## so they are kept as floats, exact rational arithmetic is only needed for population sizes.
+        if diversity_bias is not None:
+            diversity_bias = float(diversity_bias)
+        if diversity_bias_decay is not None:
+            diversity_bias_decay = float(diversity_bias_decay)
+        mutation_factor, mutation_factor_growth = float(mutation_factor), float(mutation_factor_growth)
+        
+        ## The factors of population sizes are converted to exact fractions once, such that
+        ## decimal float factors give the intended sizes without per-generation conversions.
+        expansion_factor = _exact_fraction(expansion_factor)
+        survival_factor = _exact_fraction(survival_factor)
         if survival_elitism_factor is not None:
-            population, fitness_values = zip(*sorted(zip(population, fitness_values),
-                                                        key=lambda item: item[1]))
-            population = list(population)
-            fitness_values = list(fitness_values)
+            survival_elitism_factor = _exact_fraction(survival_elitism_factor)
+        if reproduction_elitism_factor is not None:
+            reproduction_elitism_factor = _exact_fraction(reproduction_elitism_factor)
+        mutation_fraction: Fraction = _exact_fraction(mutation_factor)
+        
+        population: npt.NDArray = self.create_population(init_pop_size)
+        fitness_values: npt.NDArray[np.float64] = self.evaluate_population(population)
         
-        max_fitness, min_fitness = max(fitness_values), min(fitness_values)
+        ## If the selector requires it, the population and their fitness values are kept sorted in
+        ## ascending order of fitness, such that the selector never needs to sort, and the elite are
+        ## the individuals at the end. Otherwise, the elite are found by partitioning when needed.
+        population, fitness_values, max_index = self.__order_population(population, fitness_values)
+        
+        max_fitness: float = float(fitness_values[max_index])
         generation: int = 0
         
-        ## Variables for checking stagnation
-        best_fitness_achieved: Fraction = max_fitness
+        ## Variables for checking stagnation, the best individual is copied
+        ## since the population array may later be mutated in-place.
+        best_fitness_achieved: float = max_fitness
+        best_individual_achieved: npt.NDArray = population[max_index].copy()
         stagnated_generations: int = 0
         
-        if diversity_bias_decay_type is not None:
+        ## The decay functions are resolved once, and are None if the bias or factor is constant,
+        ## such that the loop only tests a local variable each generation.
+        diversity_bias_decay_function: Optional[Callable[[float, float], float]] = None
+        if (diversity_bias is not None and diversity_bias_decay is not None
+                and diversity_bias_decay_type is not None):
             diversity_bias_decay_function = self.get_decay_function(diversity_bias_decay_type)
+        mutation_factor_growth_function: Optional[Callable[[float, float], float]] = None
         if mutation_factor_growth_type is not None:
             mutation_factor_growth_function = self.get_decay_function(mutation_factor_growth_type)
         
+        ## Two buffers of the maximum population size are allocated once and used in turn
+        ## for the grown population of each generation, instead of allocating a new array.
+        buffers: tuple[npt.NDArray, npt.NDArray] = tuple(np.empty((max(max_pop_size, len(population)), *population.shape[1:]),
+                                                                  dtype=population.dtype)
+                                                         for _ in range(2))
+        
         progress_bar = ResourceProgressBar(initial=1, total=max_generations)
         
         while not (generation >= max_generations):
@@ -923,15 +1888,14 @@ class GeneticSystem:
                 ## Update the convergence and diversity biases;
                 ##      - Convergence increases by the decay factor,
                 ##      - Diversity reduces by the decay factor.
-                if diversity_bias_decay is not None and diversity_bias_decay_type is not None:
+                if diversity_bias_decay_function is not None:
                     diversity_bias = diversity_bias_decay_function(diversity_bias, diversity_bias_decay)
                 
                 ## Apply biases to the fitness values;
                 ##      - Diversity bias increases low fitness, encouraging exploration,
                 ##        Individuals gain fitness directly proportional to diversity bias and how much worse than the maximum fitness.
-                fitness_values = [fitness
-                                  + ((max_fitness - fitness) * diversity_bias)
-                                  for fitness in fitness_values]
+                ##      - Computed in-place on the array, since the fitness values are re-evaluated every generation.
+                fitness_values += (max_fitness - fitness_values) * diversity_bias
             
             ## Applying scaling to the fitness values.
             fitness_values = self.__selector.scale(fitness_values)
@@ -941,40 +1905,42 @@ class GeneticSystem:
             ## Select part of the existing population to survive to the next generation and cull the rest;
             ##      - The selection scheme is random (unless the elitism factor is 1.0) with chance of survival proportional to fitness.
             ##      - This step emulates Darwin's principle of survival of the fittest.
-            population, fitness_values = self.cull_population(population, fitness_values, survival_factor, survival_elitism_factor)
+            ##      - The survivors are kept as indices into the population, and are gathered only when growing it.
+            survived = self.__cull_indices(fitness_values, survival_factor, survival_elitism_factor)
+            if survived is not None:
+                fitness_values = fitness_values[survived]
             
             ## Recombine the survivors to produce offsrping and expand the population to the lower of;
             ##      - The max population size,
             ##      - increase the size by our maximum expansion factor.
-            desired_population_size: int = min(math.ceil(base_population_size * expansion_factor), max_pop_size)
-            population = self.grow_population(population, fitness_values, desired_population_size, replacement)
+            desired_population_size: int = min(_ceil_multiple(base_population_size, expansion_factor), max_pop_size)
+            ##      - If replacement is enabled, then the parents are replaced by their offspring,
+            ##        otherwise the parents survive to the next generation along with their offspring.
+            ##      - The grown population is written into whichever of the buffers is not in use.
+            buffer = buffers[0] if not np.may_share_memory(population, buffers[0]) else buffers[1]
+            population = self.grow_population(population, fitness_values, desired_population_size,
+                                              reproduction_elitism_factor,
+                                              survival_factor=(0.0 if replacement else 1.0),
+                                              survival_elitism_factor=(survival_elitism_factor or 0.0),
+                                              out=buffer, rows=survived)
             
             ## Randomly mutate the grown population
-            if generation != 0:
+            if generation != 0 and mutation_factor_growth_function is not None:
                 mutation_factor = mutation_factor_growth_function(mutation_factor, mutation_factor_growth)
-            mutated_population: list[CT] = self.mutate_population(population, fitness_values, mutation_distribution)
+                mutation_fraction = _exact_fraction(mutation_factor)
+            mutated_population: npt.NDArray = self.mutate_population(population, mutation_fraction)
             
             ## Update the population and fitness values with the new generation.
             population = mutated_population
-            fitness_values: list[Fraction] = [self.__encoder.evaluate_fitness(individual)
-                                              for individual in population]
+            fitness_values = self.evaluate_population(population)
             
-            ## If elitism is enabled the population and their fitness values need to be ordered.
-            if survival_elitism_factor is not None:
-                population, fitness_values = zip(*sorted(zip(population, fitness_values),
-                                                         key=lambda item: item[1]))
-                population = list(population)
-                fitness_values = list(fitness_values)
-                max_individual = population[-1]
-                max_fitness = fitness_values[-1]
-            else:
-                max_fitness_index, max_fitness = max(enumerate(fitness_values), key=lambda item: item[1])
-                max_individual = population[max_fitness_index]
-                min_fitness = min(fitness_values)
+            ## Restore the ordering of the population and their fitness values.
+            population, fitness_values, max_index = self.__order_population(population, fitness_values)
+            max_fitness = float(fitness_values[max_index])
             
             if max_fitness > best_fitness_achieved:
                 best_fitness_achieved = max_fitness
-                best_individual_achieved = max_individual
+                best_individual_achieved = population[max_index].copy()
             else: stagnated_generations += 1
             
             generation += 1
@@ -982,27 +1948,109 @@ class GeneticSystem:
             
             ## Determine whether the fitness threshold has been reached.
             if best_fitness_achieved >= fitness_threshold:
-                return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, population, fitness_values, max_fitness_reached=True)
+                return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, *self.sort_population(population, fitness_values), max_fitness_reached=True)
             
             ## Determine whether the stagnation limit has been reached.
             if stagnated_generations == stagnation_limit:
-                return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, population, fitness_values, stagnation_limit_reached=True)
+                return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, *self.sort_population(population, fitness_values), stagnation_limit_reached=True)
         
-        return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, population, fitness_values, max_generations_reached=True)
+        return GeneticAlgorithmSolution(best_individual_achieved, best_fitness_achieved, *self.sort_population(population, fitness_values), max_generations_reached=True)
     
-    def create_population(self, population_size: int) -> list[CT]:
-        """Create a new population of the given size."""
-        total_bits: int = self.__encoder.base.bits * self.__encoder.gene_length
-        return [format(randbits(total_bits),
-                       self.__encoder.base.format_).zfill(self.__encoder.gene_length)
-                for _ in range(population_size)]
+    def create_population(self, population_size: int) -> npt.NDArray:
+        """Create a new population of the given size, as a two-dimensional array with one chromosome per row."""
+        return self.__encoder.base.random_chromosomes(self.__encoder.chromosome_length,
+                                                      population_size,
+                                                      self.__random_generator)
+    
+    @staticmethod
+    def sort_population(population: npt.NDArray,
+                        fitness_values: npt.NDArray[np.float64]
+                        ) -> tuple[npt.NDArray, npt.NDArray[np.float64]]:
+        """
+        Return the population and their fitness values sorted in ascending order of fitness.
+        
+        The order is found by a single argsort of the fitness values, and applied to both
+        arrays by indexing, unless the fitness values are already sorted, in which case
+        the (potentially large) population array is returned without being copied.
+        """
+        if (fitness_values[:-1] <= fitness_values[1:]).all():
+            return (population, fitness_values)
+        order = np.argsort(fitness_values)
+        return (population[order], fitness_values[order])
+    
+    def __order_population(self,
+                           population: npt.NDArray,
+                           fitness_values: npt.NDArray[np.float64]
+                           ) -> tuple[npt.NDArray, npt.NDArray[np.float64], int]:
+        """
+        Return the population and their fitness values sorted in ascending order of fitness, only if the selector requires it,
+        and the index of the highest fitness individual, such that the fitness values are scanned at most once.
+        """
+        if self.__selector.requires_sorted:
+            return (*self.sort_population(population, fitness_values), len(fitness_values) - 1)
+        return (population, fitness_values, int(fitness_values.argmax()))
+    
+    def evaluate_population(self, population: npt.NDArray) -> npt.NDArray[np.float64]:
+        """
+        Evaluate the fitness of each chromosome in the population, returning an array of floats of the system's fitness type.
+        
+        If the system has a fitness cache, then only chromosomes that are
+        not in the cache are evaluated, and each distinct chromosome is
+        evaluated at most once.
+        
+        If the encoder overrides `evaluate_batch`, then the chromosomes are
+        evaluated together by a single call to it. Otherwise, if the system has
+        a pool of workers, then the population is split into chunks, such that
+        each worker receives about four chunks to evaluate.
+        """
+        cache = self.__fitness_cache
+        if cache is None:
+            return np.asarray(self.__evaluate_chromosomes(population), dtype=self.__fitness_dtype)
+        
+        keys: list[bytes] = [chromosome.tobytes() for chromosome in population]
+        
+        ## Move cache hits to the most recently used end of the cache (unless
+        ## it is unbounded), and collect the distinct chromosomes that are misses.
+        misses: dict[bytes, CT]
+        if self.__cache_size == math.inf:
+            misses = {key: chromosome for key, chromosome in zip(keys, population)
+                      if key not in cache}
+        else:
+            misses = {}
+            for key, chromosome in zip(keys, population):
+                if key in cache:
+                    cache[key] = cache.pop(key)
+                elif key not in misses:
+                    misses[key] = chromosome
+        if misses:
+            cache.update(zip(misses, self.__evaluate_chromosomes(np.array(list(misses.values())))))
+        
+        fitness_values = np.fromiter(map(cache.__getitem__, keys), dtype=self.__fitness_dtype, count=len(keys))
+        
+        ## Evict the least recently used entries if the cache is over size.
+        excess: int | float = len(cache) - self.__cache_size
+        if excess > 0:
+            for key in list(itertools.islice(cache, excess)):
+                del cache[key]
+        
+        return fitness_values
+    
+    def __evaluate_chromosomes(self, chromosomes: npt.NDArray) -> npt.NDArray[np.float64] | list[float]:
+        """Evaluate the fitness of each of the given chromosomes, in a batch, or in parallel if the system has a pool of workers."""
+        if self.__batch_evaluation:
+            return self.__encoder.evaluate_batch(chromosomes)
+        evaluate_fitness = self.__encoder.evaluate_fitness
+        if self.__pool is None:
+            return list(map(evaluate_fitness, chromosomes))
+        chunksize: int = max(1, len(chromosomes) // (4 * self.__workers))
+        return list(self.__pool.map(evaluate_fitness, chromosomes, chunksize=chunksize))
     
     def cull_population(self,
-                        population: list[CT],
-                        fitness_values: list[Fraction],
+                        population: npt.NDArray,
+                        fitness_values: npt.NDArray[np.float64],
                         survival_factor: Fraction,
                         elitism_factor: Fraction | None
-                        ) -> tuple[list[CT], list[Fraction]]:
+                        ) -> tuple[npt.NDArray, npt.NDArray[np.float64]]:
         """
         Select individuals from the current population to survive to and reproduce for the next generation.
         Individuals that do not survive are said to be culled from the population and do not get a chance to reproduce and propagate features of their genes to the next generation.
@@ -1024,54 +2072,62 @@ class GeneticSystem:
         Parameters
         ----------
         
-        `population: list` -
+        `population: NDArray` -
         
-        `fitness_values: list[Fraction]` - 
+        `fitness_values: NDArray[float64]` - 
         If `elitism_factor` is not None, then the fitness values must be sorder in ascending order.
         
         `survival_factor: Fraction` -
         
         `elitism_factor: {Fraction | None}` - 
         """
+        fitness_values = np.asarray(fitness_values, dtype=self.__fitness_dtype)
+        survived = self.__cull_indices(fitness_values, survival_factor, elitism_factor)
+        if survived is None:
+            return (population, fitness_values)
+        return (population[survived], fitness_values[survived])
+    
+    def __cull_indices(self,
+                       fitness_values: npt.NDArray[np.float64],
+                       survival_factor: Fraction,
+                       elitism_factor: Fraction | None
+                       ) -> Optional[npt.NDArray[np.intp]]:
+        """Return the indices of the individuals that survive culling, or None if all individuals survive."""
         ## The current population size and the quantity of them to choose to survive to the next generation.
-        population_size: int = len(population)
-        survive_quantity: int = math.ceil(population_size * survival_factor)
+        population_size: int = len(fitness_values)
+        survive_quantity: int = _ceil_multiple(population_size, survival_factor)
         
         ## If all individuals in the current population survive then skip the culling phase.
         if population_size == survive_quantity:
-            return (population, fitness_values)
+            return None
         
         ## If elitism factor is not given or None then always choose randomly with probability proportion.
         if elitism_factor is None:
-            return self.__selector.select(population, fitness_values, survive_quantity)
+            survived = self.__select_indices(fitness_values, survive_quantity, 0)
         
-        ## The quantity of elite individuals that are guaranteed to survive.
-        elite_quantity = math.ceil(survive_quantity * elitism_factor)
-        
-        ## If all surviving are elite, then skip random selection phase,
-        ## simply select deterministically the best individuals from the previous generation.
-        if survive_quantity == elite_quantity:
-            return (population[population_size - survive_quantity:],
-                    fitness_values[population_size - survive_quantity:])
+        ## Otherwise, the quantity of elite individuals are guaranteed to survive,
+        ## and the rest are chosen randomly from the non-elite part of the population.
+        else:
+            elite_quantity = _ceil_multiple(survive_quantity, elitism_factor)
+            survived = self.__select_indices(fitness_values, survive_quantity, elite_quantity)
         
-        ## Non-elite part of the population chosen from randomly to generate competing quantity of survive quantity
-        comp_quantity: int = survive_quantity - elite_quantity
-        comp_population: list[CT] = population[0:population_size - elite_quantity]
-        comp_fitness_values: list[Fraction] = fitness_values[0:population_size - elite_quantity]
-        comp_popluation, comp_fitness_values = self.__selector.select(comp_population, comp_fitness_values, comp_quantity)
+        ## Indices into sorted fitness values are sorted to keep the survivors sorted.
+        if self.__selector.requires_sorted:
+            survived.sort()
         
-        return (comp_popluation + population[population_size - elite_quantity:],
-                comp_fitness_values + fitness_values[population_size - elite_quantity:])
+        return survived
     
     def grow_population(self,
-                        population: list[CT],
-                        fitness_values: Optional[list[Fraction]],
+                        population: npt.NDArray,
+                        fitness_values: Optional[npt.NDArray[np.float64]],
                         desired_population_size: int,
                         reproduction_elitism_factor: Fraction | None,
                         survival_factor: Fraction,
                         survival_elitism_factor: Fraction = Fraction(0.0), # These are added to `offspring` as an initial stage.
                         # These ones require us to check the individual is not already in the population, use set membership lookup (on index?), remember that it is allowed for the exact same chromosome to exist in the population more than once.
-                        ) -> list[CT]:
+                        out: Optional[npt.NDArray] = None,
+                        rows: Optional[npt.NDArray[np.intp]] = None
+                        ) -> npt.NDArray:
         """
         Grow the population to the desired size.
         
@@ -1091,59 +2147,122 @@ class GeneticSystem:
         done by choosing parent pairs from the reproductive elite set without
         replacement first, as a seperate initial stage of the population growth.
         Once the elite set is consumed, then return to the usual reproduction mechanism.
-        """
-        offspring: list[CT] = []
         
+        `out: Optional[NDArray] = None` - An array with at least the desired number of rows,
+        and the same row shape and type as the population, that must not share memory with it.
+        If given, then any offspring produced are written into the leading rows of this array
+        and a view of them is returned, instead of allocating a new array for the grown population.
+        
+        `rows: Optional[NDArray[intp]] = None` - If given, then the population to grow consists of
+        only the given rows of `population`, and the fitness values are those of these rows only.
+        This allows a culled population to be grown without first gathering it into a new array.
+        """
         ## The current population size and the quantity of them to choose to survive to the next generation.
-        population_size: int = len(population)
-        survive_quantity: int = math.ceil(population_size * survival_factor)
+        population_size: int = len(population) if rows is None else len(rows)
+        survive_quantity: int = _ceil_multiple(population_size, survival_factor)
         
         ## If all individuals in the current population survive then skip the reproduction phase.
         if desired_population_size == survive_quantity:
-            return population
-        
-        ##
-        elite_survive_quantity: int = math.ceil(survive_quantity * survival_elitism_factor)
-        comp_survive_quantity: int = survive_quantity - elite_survive_quantity
+            return population if rows is None else population[rows]
         
-        ##
-        survived = population[-elite_survive_quantity:]
-        survived.extend(self.__selector.select(population[:-elite_survive_quantity],
-                                               fitness_values[:-elite_survive_quantity],
-                                               comp_survive_quantity))
-        offspring.extend(survived)
+        ## The elite survivors are always chosen, and the rest are chosen by the selector.
+        elite_survive_quantity: int = _ceil_multiple(survive_quantity, survival_elitism_factor)
+        fitness_values = np.asarray(fitness_values, dtype=self.__fitness_dtype)
+        survivor_indices = self.__select_indices(fitness_values, survive_quantity, elite_survive_quantity)
+        if rows is not None:
+            survivor_indices = rows[survivor_indices]
         
         ##
         offspring_quantity: int = desired_population_size - survive_quantity
         if offspring_quantity == 0:
-            return offspring
+            return population[survivor_indices]
+        
+        ## The grown population is allocated once, the survivors are gathered
+        ## directly into its start and the offspring are written after them.
+        if out is None:
+            grown_population: npt.NDArray = np.empty((desired_population_size, *population.shape[1:]), dtype=population.dtype)
+        else: grown_population = out[:desired_population_size]
+        np.take(population, survivor_indices, axis=0, out=grown_population[:survive_quantity])
         
         ## Select parent pairs with uniform probability with replacement.
         total_parents: int = (offspring_quantity + (offspring_quantity % 2))
-        elite_reprod_quantity: int = math.ceil(total_parents * reproduction_elitism_factor)
-        elite_reprod_quantity += elite_reprod_quantity % 2
-        comp_reprod_quantity: int = total_parents - elite_reprod_quantity
-        
-        ##
-        selected = population[-elite_reprod_quantity:]
-        selected.extend(self.__selector.select(population[:-elite_reprod_quantity],
-                                               fitness_values[:-elite_reprod_quantity],
-                                               comp_reprod_quantity))
-        parent_pairs: Iterator[tuple[CT, CT]] = chunk(selected, 2, comp_reprod_quantity // 2, as_type=tuple)
-        
-        ##
-        for parent_1, parent_2 in parent_pairs:
-            children: list[CT] = self.__recombinator.recombine(parent_1, parent_2)
-            max_children: int = min(len(children), offspring_quantity - (len(offspring) - survive_quantity))
-            offspring.extend(children[:max_children])
-        
-        return offspring
+        elite_reprod_quantity: int = 0
+        if reproduction_elitism_factor is not None:
+            elite_reprod_quantity = _ceil_multiple(total_parents, reproduction_elitism_factor)
+            elite_reprod_quantity += elite_reprod_quantity % 2
+        
+        ## Consecutive selected parents form pairs, gathered as two arrays of first and second parents.
+        selected = self.__select_indices(fitness_values, total_parents, elite_reprod_quantity)
+        if rows is not None:
+            selected = rows[selected]
+        parents_1, parents_2 = population[selected[0::2]], population[selected[1::2]]
+        
+        ## Each pair of parents produces a pair of offspring, all pairs are recombined in one batch,
+        ## and the offspring are interleaved in pairs after the survivors, the last of which
+        ## is discarded if an odd number of offspring are needed.
+        offspring_1, offspring_2 = self.__recombinator.recombine_batch(parents_1, parents_2)
+        offspring: npt.NDArray = grown_population[survive_quantity:]
+        offspring[0::2] = offspring_1[:len(offspring[0::2])]
+        offspring[1::2] = offspring_2[:len(offspring[1::2])]
+        
+        return grown_population
+    
+    def __select_indices(self,
+                         fitness_values: npt.NDArray[np.float64],
+                         quantity: int,
+                         elite_quantity: int
+                         ) -> npt.NDArray[np.intp]:
+        """
+        Select the indices of the given quantity of individuals from a population with the given fitness values.
+        
+        The elite quantity of individuals with the highest fitness are always selected,
+        and the rest are chosen by the selector from the non-elite part of the population.
+        If the elite quantity exceeds the population size, the whole population is elite,
+        and the rest are chosen by the selector from the whole population.
+        If the selector requires sorted fitness values, then they must be sorted in ascending
+        order, otherwise the elite are found by partitioning the fitness values. Selecting
+        indices allows the population and its fitness values to be co-indexed, instead
+        of selecting from a sequence of (chromosome, fitness) pairs.
+        """
+        if elite_quantity == 0:
+            return self.__selector.select_indices(fitness_values, quantity)
+        
+        ## There cannot be more elite than individuals in the population.
+        elite_quantity = min(elite_quantity, len(fitness_values))
+        elite_start: int = len(fitness_values) - elite_quantity
+        
+        ## If the whole population is elite, the selector chooses the remainder from the whole population.
+        ## Otherwise, if the fitness values are sorted, the selector chooses from a view of the non-elite
+        ## fitness values, otherwise the elite are partitioned from the rest in linear time.
+        if elite_start == 0:
+            elite_indices = np.arange(len(fitness_values))
+            if quantity == elite_quantity:
+                return elite_indices
+            comp_indices = self.__selector.select_indices(fitness_values, quantity - elite_quantity)
+        elif self.__selector.requires_sorted:
+            elite_indices = np.arange(elite_start, len(fitness_values))
+            if quantity == elite_quantity:
+                return elite_indices
+            comp_indices = self.__selector.select_indices(fitness_values[:elite_start], quantity - elite_quantity)
+        else:
+            order = np.argpartition(fitness_values, elite_start)
+            elite_indices = order[elite_start:]
+            if quantity == elite_quantity:
+                return elite_indices
+            non_elite_indices = order[:elite_start]
+            comp_indices = non_elite_indices[self.__selector.select_indices(fitness_values[non_elite_indices],
+                                                                            quantity - elite_quantity)]
+        
+        indices = np.empty(quantity, dtype=np.intp)
+        indices[:quantity - elite_quantity] = comp_indices
+        indices[quantity - elite_quantity:] = elite_indices
+        return indices
     
     def mutate_population(self,
-                          population: list[CT],
-                          mutation_factor: Fraction = Fraction(1),
+                          population: npt.NDArray,
+                          mutation_factor: float | Fraction = 1.0,
                           mutate_all: bool = True
-                          ) -> list[CT]:
+                          ) -> npt.NDArray:
         """
         Mutate the population.
         
@@ -1155,36 +2274,29 @@ class GeneticSystem:
         equal to the non-integer part of the factor, i.e. `math.floor(len(population) * (mutation_factor % 1.0))`.
         If `mutate_all` is False then instead randomly choose a number of
         individuals from the population to mutate (with replacement) equal to `math.floor(len(population) * mutation_factor)`.
+        
+        The population is mutated in-place and returned, it is not copied.
+        Callers that need to retain the original population must copy it first.
         """
-        ##
-        mutations_quantity: int = math.floor(len(population) * mutation_factor)
-        mutated_population: list[CT] = population
+        population_size: int = len(population)
+        mutations_quantity: int = _floor_multiple(population_size, mutation_factor)
+        if mutations_quantity == 0:
+            return population
         
-        if isinstance(self.__encoder.base, BitStringBase):
-            mutate = self.__mutator.bitstring_mutate
-        elif isinstance(self.__encoder.base, NumericalBase):
-            mutate = self.__mutator.numerical_mutate
-        else:
-            mutate = self.__mutator.arbitrary_mutate
-        
-        if (mutate_all and mutations_quantity >= len(population)):
-            cycles: int = mutations_quantity // len(population)
-            for index in cycle_for(range(len(population)), cycles):
-                mutated_population[index] = mutate(mutated_population[index],
-                                                   self.__encoder.base)
-            mutations_quantity -= len(population) * cycles
-            # else: mutations_quantity %= len(population) ## TODO
-        
-        if (not mutate_all
-            or mutations_quantity != 0):
-            for index in self.__random_generator.choice(len(population), mutations_quantity):
-                mutated_population[index] = mutate(mutated_population[index],
-                                                   self.__encoder.base)
-        
-        return mutated_population
+        ## Each individual is mutated once per whole cycle of the population, and the remaining
+        ## individuals to mutate are chosen randomly. The rows of both phases are gathered into
+        ## one index array, such that the mutator mutates the whole population in one call.
+        cycles, remainder = divmod(mutations_quantity, population_size) if mutate_all else (0, mutations_quantity)
+        rows = np.concatenate((np.tile(np.arange(population_size, dtype=np.intp), cycles),
+                               self.__random_generator.integers(0, population_size, size=remainder, dtype=np.intp)))
+        
+        return self.__mutate_rows(population, rows)
 
-@enum.unique
-class DecayType(enum.Enum):
-    lin = (GeneticSystem.linear_decay,)
-    pol = (GeneticSystem.polynomial_decay,)
-    exp = (GeneticSystem.exponential_decay,)
+class DecayType:
+    """The standard decay functions of genetic systems, accessible by name."""
+    
+    __slots__ = ()
+    
+    lin = staticmethod(GeneticSystem.linear_decay)
+    pol = staticmethod(GeneticSystem.polynomial_decay)
+    exp = staticmethod(GeneticSystem.exponential_decay)